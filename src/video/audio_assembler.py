@@ -73,8 +73,8 @@ def assemble_audio(
 
             cmd = [
                 "ffmpeg", "-y",
-                "-i", audio_path,
                 "-ss", str(seg["start"]),
+                "-i", audio_path,
                 "-t", str(duration),
                 "-acodec", "pcm_s16le",
                 "-ar", "16000",
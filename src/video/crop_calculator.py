@@ -16,10 +16,18 @@ Usage:
     )
 """
 
+import json
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, NamedTuple, Callable
 from enum import Enum
 
+import numpy as np
+
+try:
+    import orjson  # Optional: C-level JSON encoding for to_json_bytes()
+except ImportError:
+    orjson = None
+
 from src.video.export_formats import (
     ExportFormat,
     FormatSpec,
@@ -37,12 +45,26 @@ class CropConfidence(Enum):
     FAILED = "failed"       # Cannot determine crop (no subject detected)
 
 
-@dataclass
-class CropRegion:
+# Confidence level by number of thresholds met (MEDIUM, HIGH); FAILED is checked first
+_CONFIDENCE_TABLE: Tuple[CropConfidence, ...] = (
+    CropConfidence.LOW,
+    CropConfidence.MEDIUM,
+    CropConfidence.HIGH,
+)
+_CONFIDENCE_HIGH = CropConfidence.HIGH
+_CONFIDENCE_FAILED = CropConfidence.FAILED
+
+# Default format set for calculate_all_crops
+_ALL_FORMATS: Tuple[ExportFormat, ...] = tuple(ExportFormat)
+
+
+class CropRegion(NamedTuple):
     """
     A calculated crop region with pixel coordinates.
 
     All coordinates are relative to the SCALED source (not original).
+    Immutable value type - a NamedTuple is cheaper to build than a dataclass
+    and unpacks directly into array columns for batch processing.
     """
     x: int                  # Left edge of crop
     y: int                  # Top edge of crop
@@ -84,14 +106,96 @@ class CropRegion:
         return f"scale={self.scaled_width}:{self.scaled_height},{self.to_ffmpeg_crop()}"
 
 
-@dataclass
-class CropIssue:
+class CropIssue(NamedTuple):
     """An issue detected with the crop."""
     severity: str          # "warning" or "error"
     code: str              # Machine-readable code
     message: str           # Human-readable description
 
 
+# Issue bits for batch validation, in the order issues are reported.
+ISSUE_HEAD_TOO_HIGH = 1 << 0
+ISSUE_SUBJECT_TOO_LOW = 1 << 1
+ISSUE_SUBJECT_NEAR_LEFT = 1 << 2
+ISSUE_SUBJECT_NEAR_RIGHT = 1 << 3
+ISSUE_SUBJECT_OUTSIDE_X = 1 << 4
+ISSUE_SUBJECT_OUTSIDE_Y = 1 << 5
+
+# (bit, severity, code, message) - messages may use head_in_crop_y/min_top_margin
+_ISSUE_TABLE: Tuple[Tuple[int, str, str, str], ...] = (
+    (ISSUE_HEAD_TOO_HIGH, "warning", "head_too_high",
+     "Head may be cut off at top (head at {head_in_crop_y}px, min margin {min_top_margin}px)"),
+    (ISSUE_SUBJECT_TOO_LOW, "warning", "subject_too_low",
+     "Subject may overlap with caption area"),
+    (ISSUE_SUBJECT_NEAR_LEFT, "warning", "subject_near_left",
+     "Subject close to left edge"),
+    (ISSUE_SUBJECT_NEAR_RIGHT, "warning", "subject_near_right",
+     "Subject close to right edge"),
+    (ISSUE_SUBJECT_OUTSIDE_X, "error", "subject_outside_crop_x",
+     "Subject is outside crop area horizontally"),
+    (ISSUE_SUBJECT_OUTSIDE_Y, "error", "subject_outside_crop_y",
+     "Subject is outside crop area vertically"),
+)
+
+ISSUE_ERROR_MASK = ISSUE_SUBJECT_OUTSIDE_X | ISSUE_SUBJECT_OUTSIDE_Y
+
+# Confidence multiplier per issue bit: major reduction for errors, minor for warnings
+_ISSUE_SCORE_FACTORS: Tuple[Tuple[int, float], ...] = tuple(
+    (bit, 0.5 if severity == "error" else 0.9)
+    for bit, severity, _code, _message in _ISSUE_TABLE
+)
+
+
+# Shared CropIssue instances for issues whose message has no dynamic parts.
+# CropIssue is an immutable NamedTuple, so one instance per code is safe to reuse.
+_INTERNED_ISSUES: Dict[int, CropIssue] = {
+    bit: CropIssue(severity=severity, code=code, message=message)
+    for bit, severity, code, message in _ISSUE_TABLE
+    if "{" not in message
+}
+
+
+def issues_from_flags(flags: int, head_in_crop_y: int = 0, min_top_margin: int = 0) -> List[CropIssue]:
+    """
+    Materialize CropIssue objects from an issue bitmask.
+
+    Issues with static messages are shared interned instances; only the
+    head_too_high message is formatted per call.
+
+    Args:
+        flags: Bitwise OR of ISSUE_* values
+        head_in_crop_y: Head offset inside the crop (for the head_too_high message)
+        min_top_margin: Required top margin (for the head_too_high message)
+
+    Returns:
+        Issues in reporting order
+    """
+    if not flags:
+        return []
+    issues = []
+    for bit, severity, code, message in _ISSUE_TABLE:
+        if flags & bit:
+            issue = _INTERNED_ISSUES.get(bit)
+            if issue is None:
+                issue = CropIssue(
+                    severity=severity,
+                    code=code,
+                    message=message.format(
+                        head_in_crop_y=head_in_crop_y,
+                        min_top_margin=min_top_margin,
+                    ),
+                )
+            issues.append(issue)
+    return issues
+
+
+def _dump_json_bytes(payload: Dict[str, Any]) -> bytes:
+    """Encode a to_dict() payload as UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
 @dataclass
 class CropResult:
     """Result of crop calculation for a single format."""
@@ -134,28 +238,91 @@ class CropResult:
             "needs_review": self.needs_review,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() straight to JSON bytes (orjson if available)."""
+        return _dump_json_bytes(self.to_dict())
+
 
 @dataclass
-class MultiFormatCropResult:
-    """Crop results for multiple formats."""
+class MultiFormatCropResultSoA:
+    """
+    Crop results for multiple formats, stored column-wise.
+
+    Each array holds one entry per format, in the order of ``formats``.
+    Aggregate queries (auto-approval, review list) reduce over a single
+    array instead of walking a dict of CropResult objects. Per-format
+    CropResult views are rebuilt on demand by ``get_result``.
+    """
     source_width: int
     source_height: int
-    results: Dict[ExportFormat, CropResult]
+    formats: List[ExportFormat]
+    xs: np.ndarray                  # int64 crop x per format
+    ys: np.ndarray                  # int64 crop y per format
+    widths: np.ndarray              # int64 crop width per format
+    heights: np.ndarray             # int64 crop height per format
+    scales: np.ndarray              # float64 scale factor per format
+    scaled_widths: np.ndarray       # int64 scaled source width per format
+    scaled_heights: np.ndarray      # int64 scaled source height per format
+    confidence_scores: np.ndarray   # float64 0-1 score per format
+    auto_approve: np.ndarray        # bool per format
+    confidences: List[CropConfidence]
+    issue_flags: np.ndarray         # uint16 ISSUE_* bitmask per format
+    head_in_crop_ys: np.ndarray     # int64 head offset inside crop per format
+    min_top_margins: np.ndarray     # int64 required top margin per format
+    subject_position: Optional[SubjectPosition]
     movement_analysis: Optional[MovementAnalysis]
 
+    def issues_at(self, i: int) -> List[CropIssue]:
+        """Materialize the CropIssue list for column ``i``."""
+        return issues_from_flags(
+            int(self.issue_flags[i]),
+            int(self.head_in_crop_ys[i]),
+            int(self.min_top_margins[i]),
+        )
+
+    def _result_at(self, i: int) -> CropResult:
+        """Rebuild the CropResult view for column ``i``."""
+        fmt = self.formats[i]
+        return CropResult(
+            format=fmt,
+            format_spec=get_format(fmt),
+            crop=CropRegion(
+                x=int(self.xs[i]),
+                y=int(self.ys[i]),
+                width=int(self.widths[i]),
+                height=int(self.heights[i]),
+                scale=float(self.scales[i]),
+                scaled_width=int(self.scaled_widths[i]),
+                scaled_height=int(self.scaled_heights[i]),
+            ),
+            subject_position=self.subject_position,
+            confidence=self.confidences[i],
+            confidence_score=float(self.confidence_scores[i]),
+            issues=self.issues_at(i),
+            auto_approve=bool(self.auto_approve[i]),
+        )
+
     def get_result(self, format: ExportFormat) -> Optional[CropResult]:
         """Get result for a specific format."""
-        return self.results.get(format)
+        try:
+            return self._result_at(self.formats.index(format))
+        except ValueError:
+            return None
+
+    @property
+    def results(self) -> Dict[ExportFormat, CropResult]:
+        """Per-format CropResult views, keyed by format."""
+        return {fmt: self._result_at(i) for i, fmt in enumerate(self.formats)}
 
     @property
     def all_auto_approved(self) -> bool:
         """Check if all formats are auto-approved."""
-        return all(r.auto_approve for r in self.results.values())
+        return bool(self.auto_approve.all())
 
     @property
     def formats_needing_review(self) -> List[ExportFormat]:
         """Get list of formats that need review."""
-        return [f for f, r in self.results.items() if r.needs_review]
+        return [self.formats[i] for i in np.flatnonzero(~self.auto_approve)]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -169,11 +336,84 @@ class MultiFormatCropResult:
                 "max_drift": self.movement_analysis.max_drift,
                 "requires_tracking": self.movement_analysis.requires_tracking,
             } if self.movement_analysis else None,
-            "results": {f.value: r.to_dict() for f, r in self.results.items()},
+            "results": {
+                fmt.value: self._result_at(i).to_dict()
+                for i, fmt in enumerate(self.formats)
+            },
             "all_auto_approved": self.all_auto_approved,
             "formats_needing_review": [f.value for f in self.formats_needing_review],
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() straight to JSON bytes (orjson if available)."""
+        return _dump_json_bytes(self.to_dict())
+
+
+# calculate_all_crops() returns the column-wise result; keep the old name importable
+MultiFormatCropResult = MultiFormatCropResultSoA
+
+
+BaseCropFn = Callable[[int, int, Optional[SubjectPosition]], CropRegion]
+
+
+def make_base_crop_fn(format_spec: FormatSpec) -> BaseCropFn:
+    """
+    Build a base-crop function specialized to one format.
+
+    The format's dimensions and target head offset are captured once, and
+    the aspect-ratio comparison is an integer cross-multiplication, so each
+    call only divides once (for the scale factor).
+
+    Args:
+        format_spec: Target format specification
+
+    Returns:
+        fn(source_width, source_height, subject_position) -> CropRegion
+        giving the crop region before validation
+    """
+    crop_width = format_spec.width
+    crop_height = format_spec.height
+    half_crop_width = crop_width // 2
+    # Target: head at format_spec.subject_head_position
+    target_head_y = int(format_spec.subject_head_position * crop_height)
+
+    def base_crop(
+        source_width: int,
+        source_height: int,
+        subject_position: Optional[SubjectPosition],
+    ) -> CropRegion:
+        # source_width / source_height > crop_width / crop_height, without division
+        if source_width * crop_height > crop_width * source_height:
+            # Source is wider than target - scale by height, crop sides
+            scale = crop_height / source_height
+            scaled_width = int(source_width * scale)
+
+            # Position crop based on subject
+            if subject_position:
+                crop_x = int(subject_position.x * scaled_width) - half_crop_width
+            else:
+                crop_x = (scaled_width - crop_width) // 2  # Center
+
+            # Clamp to valid range
+            crop_x = max(0, min(crop_x, scaled_width - crop_width))
+            return CropRegion(crop_x, 0, crop_width, crop_height, scale, scaled_width, crop_height)
+
+        # Source is taller or same aspect - scale by width, crop top/bottom
+        scale = crop_width / source_width
+        scaled_height = int(source_height * scale)
+
+        # Position based on subject's head position
+        if subject_position:
+            crop_y = int(subject_position.head_y * scaled_height) - target_head_y
+        else:
+            crop_y = (scaled_height - crop_height) // 2  # Center
+
+        # Clamp to valid range
+        crop_y = max(0, min(crop_y, scaled_height - crop_height))
+        return CropRegion(0, crop_y, crop_width, crop_height, scale, crop_width, scaled_height)
+
+    return base_crop
+
 
 class CropCalculator:
     """
@@ -192,7 +432,10 @@ class CropCalculator:
     SIDE_MARGIN = 0.10          # Minimum margin on sides (10%)
 
     def __init__(self):
-        pass
+        # Per-format crop functions with the format constants baked in
+        self._base_crop_fns: Dict[ExportFormat, BaseCropFn] = {
+            spec.format: make_base_crop_fn(spec) for spec in get_all_formats()
+        }
 
     def calculate_crop(
         self,
@@ -213,61 +456,13 @@ class CropCalculator:
         Returns:
             CropResult with calculated crop and confidence
         """
-        format_spec = get_format(target_format)
-        issues: List[CropIssue] = []
-
-        # Calculate base crop region
-        crop = self._calculate_base_crop(
+        return self._compute_result(
             source_width,
             source_height,
-            format_spec,
+            get_format(target_format),
             subject_position,
         )
 
-        # Validate and adjust crop
-        if subject_position:
-            crop, validation_issues = self._validate_subject_in_crop(
-                crop,
-                format_spec,
-                subject_position,
-            )
-            issues.extend(validation_issues)
-
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence(
-            subject_position,
-            crop,
-            format_spec,
-            issues,
-        )
-
-        # Determine confidence level
-        if not subject_position or subject_position.confidence < 0.3:
-            confidence = CropConfidence.FAILED
-        elif confidence_score >= self.HIGH_CONFIDENCE_THRESHOLD:
-            confidence = CropConfidence.HIGH
-        elif confidence_score >= self.MEDIUM_CONFIDENCE_THRESHOLD:
-            confidence = CropConfidence.MEDIUM
-        else:
-            confidence = CropConfidence.LOW
-
-        # Determine auto-approval
-        auto_approve = (
-            confidence == CropConfidence.HIGH and
-            not any(i.severity == "error" for i in issues)
-        )
-
-        return CropResult(
-            format=target_format,
-            format_spec=format_spec,
-            crop=crop,
-            subject_position=subject_position,
-            confidence=confidence,
-            confidence_score=confidence_score,
-            issues=issues,
-            auto_approve=auto_approve,
-        )
-
     def calculate_all_crops(
         self,
         source_width: int,
@@ -275,7 +470,7 @@ class CropCalculator:
         subject_position: Optional[SubjectPosition] = None,
         movement_analysis: Optional[MovementAnalysis] = None,
         formats: Optional[List[ExportFormat]] = None,
-    ) -> MultiFormatCropResult:
+    ) -> MultiFormatCropResultSoA:
         """
         Calculate crops for multiple formats.
 
@@ -287,7 +482,7 @@ class CropCalculator:
             formats: Specific formats to calculate (None = all)
 
         Returns:
-            MultiFormatCropResult with all crop calculations
+            MultiFormatCropResultSoA with all crop calculations
         """
         # Use average position if movement analysis provided
         if movement_analysis and not subject_position:
@@ -301,196 +496,222 @@ class CropCalculator:
                 description="Average position from movement analysis",
             )
 
-        # Calculate for each format
-        target_formats = formats or list(ExportFormat)
-        results = {}
+        # Calculate base crop for each format, then validate and score as a batch
+        target_formats = formats or _ALL_FORMATS
+        format_specs = [get_format(fmt) for fmt in target_formats]
+        crops = np.array(
+            [
+                self._base_crop_fns[spec.format](source_width, source_height, subject_position)
+                for spec in format_specs
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 7)
+        int_crops = crops.astype(np.int64)
+        num_formats = len(format_specs)
 
-        for fmt in target_formats:
-            result = self.calculate_crop(
-                source_width,
-                source_height,
-                fmt,
-                subject_position,
+        if subject_position:
+            caption_margins = np.array(
+                [spec.caption_margin_bottom for spec in format_specs], dtype=np.int64
+            )
+            issue_flags, head_in_crop_ys, min_top_margins = self._validate_batch(
+                int_crops, caption_margins, subject_position
             )
-            results[fmt] = result
+            confidence_scores = self._calculate_confidence_batch(subject_position, issue_flags)
+        else:
+            issue_flags = np.zeros(num_formats, dtype=np.uint16)
+            head_in_crop_ys = np.zeros(num_formats, dtype=np.int64)
+            min_top_margins = np.zeros(num_formats, dtype=np.int64)
+            confidence_scores = np.zeros(num_formats, dtype=np.float64)
+
+        # Determine confidence levels and auto-approval
+        if not subject_position or subject_position.confidence < 0.3:
+            confidences = [_CONFIDENCE_FAILED] * num_formats
+            is_high = np.zeros(num_formats, dtype=bool)
+        else:
+            levels = (
+                (confidence_scores >= self.MEDIUM_CONFIDENCE_THRESHOLD).astype(np.int64)
+                + (confidence_scores >= self.HIGH_CONFIDENCE_THRESHOLD)
+            )
+            confidences = [_CONFIDENCE_TABLE[level] for level in levels.tolist()]
+            is_high = levels == 2
+        auto_approve = is_high & ((issue_flags & ISSUE_ERROR_MASK) == 0)
 
-        return MultiFormatCropResult(
+        return MultiFormatCropResultSoA(
             source_width=source_width,
             source_height=source_height,
-            results=results,
+            formats=list(target_formats),
+            xs=int_crops[:, 0],
+            ys=int_crops[:, 1],
+            widths=int_crops[:, 2],
+            heights=int_crops[:, 3],
+            scales=crops[:, 4],
+            scaled_widths=int_crops[:, 5],
+            scaled_heights=int_crops[:, 6],
+            confidence_scores=confidence_scores,
+            auto_approve=auto_approve,
+            confidences=confidences,
+            issue_flags=issue_flags,
+            head_in_crop_ys=head_in_crop_ys,
+            min_top_margins=min_top_margins,
+            subject_position=subject_position,
             movement_analysis=movement_analysis,
         )
 
-    def _calculate_base_crop(
+    def _compute_result(
         self,
         source_width: int,
         source_height: int,
         format_spec: FormatSpec,
         subject_position: Optional[SubjectPosition],
-    ) -> CropRegion:
-        """Calculate base crop region before validation."""
-        source_aspect = source_width / source_height
-        target_aspect = format_spec.width / format_spec.height
-
-        if source_aspect > target_aspect:
-            # Source is wider than target - scale by height, crop sides
-            scale = format_spec.height / source_height
-            scaled_width = int(source_width * scale)
-            scaled_height = format_spec.height
+    ) -> CropResult:
+        """
+        Calculate, validate and score the crop for one format in a single pass.
 
-            crop_width = format_spec.width
-            crop_height = format_spec.height
+        Subject pixel coordinates are derived once and shared by the
+        placement checks; checks are evaluated into an ISSUE_* bitmask and
+        CropIssue objects are only built for the bits that are set.
+        """
+        crop = self._base_crop_fns[format_spec.format](
+            source_width,
+            source_height,
+            subject_position,
+        )
 
-            # Position crop based on subject
-            if subject_position:
-                subject_x_px = int(subject_position.x * scaled_width)
-                crop_x = subject_x_px - (crop_width // 2)
-            else:
-                crop_x = (scaled_width - crop_width) // 2  # Center
+        if not subject_position:
+            return CropResult(
+                format=format_spec.format,
+                format_spec=format_spec,
+                crop=crop,
+                subject_position=None,
+                confidence=_CONFIDENCE_FAILED,
+                confidence_score=0.0,
+                issues=[],
+                auto_approve=False,
+            )
 
-            # Clamp to valid range
-            crop_x = max(0, min(crop_x, scaled_width - crop_width))
-            crop_y = 0
+        x, y, width, height, _scale, scaled_width, scaled_height = crop
 
-        else:
-            # Source is taller or same aspect - scale by width, crop top/bottom
-            scale = format_spec.width / source_width
-            scaled_width = format_spec.width
-            scaled_height = int(source_height * scale)
+        # Convert subject position to pixel coordinates in scaled space
+        subject_x_px = int(subject_position.x * scaled_width)
+        subject_y_px = int(subject_position.y * scaled_height)
+        head_y_px = int(subject_position.head_y * scaled_height)
+
+        # Validate subject placement
+        head_in_crop_y = head_y_px - y
+        min_top_margin = int(self.HEAD_TOP_MARGIN * height)
+        max_bottom = height - format_spec.caption_margin_bottom - 50  # Leave room for captions
+        subject_in_crop_x = subject_x_px - x
+        min_side_margin = int(self.SIDE_MARGIN * width)
+        near_left = subject_in_crop_x < min_side_margin
+
+        flags = (
+            (head_in_crop_y < min_top_margin) * ISSUE_HEAD_TOO_HIGH
+            | (subject_y_px - y > max_bottom) * ISSUE_SUBJECT_TOO_LOW
+            | near_left * ISSUE_SUBJECT_NEAR_LEFT
+            | (not near_left and subject_in_crop_x > width - min_side_margin) * ISSUE_SUBJECT_NEAR_RIGHT
+            | (subject_x_px < x or subject_x_px > x + width) * ISSUE_SUBJECT_OUTSIDE_X
+            | (subject_y_px < y or subject_y_px > y + height) * ISSUE_SUBJECT_OUTSIDE_Y
+        )
 
-            crop_width = format_spec.width
-            crop_height = format_spec.height
+        # Score: start with detection confidence, reduce for each issue
+        score = subject_position.confidence
+        if flags:
+            for bit, factor in _ISSUE_SCORE_FACTORS:
+                if flags & bit:
+                    score *= factor
 
-            # Position based on subject's head position
-            if subject_position:
-                # Target: head at format_spec.subject_head_position
-                target_head_y = int(format_spec.subject_head_position * crop_height)
-                subject_head_y_px = int(subject_position.head_y * scaled_height)
+        # Bonus for subject being well-centered / head well-positioned
+        if subject_position.is_centered:
+            score = min(1.0, score * 1.05)
+        if subject_position.head_in_frame:
+            score = min(1.0, score * 1.03)
+        score = max(0.0, min(1.0, score))
 
-                # Calculate crop_y to align head with target position
-                crop_y = subject_head_y_px - target_head_y
-            else:
-                # Default: center crop
-                crop_y = (scaled_height - crop_height) // 2
+        # Determine confidence level and auto-approval
+        if subject_position.confidence < 0.3:
+            confidence = _CONFIDENCE_FAILED
+        else:
+            confidence = _CONFIDENCE_TABLE[
+                (score >= self.MEDIUM_CONFIDENCE_THRESHOLD)
+                + (score >= self.HIGH_CONFIDENCE_THRESHOLD)
+            ]
+        auto_approve = confidence is _CONFIDENCE_HIGH and not flags & ISSUE_ERROR_MASK
 
-            # Clamp to valid range
-            crop_y = max(0, min(crop_y, scaled_height - crop_height))
-            crop_x = 0
-
-        return CropRegion(
-            x=crop_x,
-            y=crop_y,
-            width=crop_width,
-            height=crop_height,
-            scale=scale,
-            scaled_width=scaled_width,
-            scaled_height=scaled_height,
+        return CropResult(
+            format=format_spec.format,
+            format_spec=format_spec,
+            crop=crop,
+            subject_position=subject_position,
+            confidence=confidence,
+            confidence_score=score,
+            issues=issues_from_flags(flags, head_in_crop_y, min_top_margin),
+            auto_approve=auto_approve,
         )
 
-    def _validate_subject_in_crop(
+    def _validate_batch(
         self,
-        crop: CropRegion,
-        format_spec: FormatSpec,
+        crops: np.ndarray,
+        caption_margins: np.ndarray,
         subject_position: SubjectPosition,
-    ) -> Tuple[CropRegion, List[CropIssue]]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Validate that subject is properly positioned in crop.
+        Validate subject placement for many crops at once.
+
+        Vectorized equivalent of the checks in _compute_result. Issues are
+        reported as a bitmask per crop; CropIssue objects are only built
+        when a result is actually read.
+
+        Args:
+            crops: (F, 7) int array of CropRegion fields
+            caption_margins: (F,) caption_margin_bottom per crop
+            subject_position: Detected subject position
 
-        Returns adjusted crop and list of issues.
+        Returns:
+            (issue_flags, head_in_crop_ys, min_top_margins) arrays of length F
         """
-        issues: List[CropIssue] = []
+        x, y, width, height = crops[:, 0], crops[:, 1], crops[:, 2], crops[:, 3]
+        scaled_width, scaled_height = crops[:, 5], crops[:, 6]
 
         # Convert subject position to pixel coordinates in scaled space
-        subject_x_px = int(subject_position.x * crop.scaled_width)
-        subject_y_px = int(subject_position.y * crop.scaled_height)
-        head_y_px = int(subject_position.head_y * crop.scaled_height)
-
-        # Check if head has enough top margin
-        head_in_crop_y = head_y_px - crop.y
-        min_top_margin = int(self.HEAD_TOP_MARGIN * crop.height)
-
-        if head_in_crop_y < min_top_margin:
-            issues.append(CropIssue(
-                severity="warning",
-                code="head_too_high",
-                message=f"Head may be cut off at top (head at {head_in_crop_y}px, min margin {min_top_margin}px)",
-            ))
-
-        # Check if subject is too close to bottom
-        subject_in_crop_y = subject_y_px - crop.y
-        max_bottom = crop.height - format_spec.caption_margin_bottom - 50  # Leave room for captions
-
-        if subject_in_crop_y > max_bottom:
-            issues.append(CropIssue(
-                severity="warning",
-                code="subject_too_low",
-                message="Subject may overlap with caption area",
-            ))
-
-        # Check horizontal margins
-        subject_in_crop_x = subject_x_px - crop.x
-        min_side_margin = int(self.SIDE_MARGIN * crop.width)
-
-        if subject_in_crop_x < min_side_margin:
-            issues.append(CropIssue(
-                severity="warning",
-                code="subject_near_left",
-                message="Subject close to left edge",
-            ))
-        elif subject_in_crop_x > crop.width - min_side_margin:
-            issues.append(CropIssue(
-                severity="warning",
-                code="subject_near_right",
-                message="Subject close to right edge",
-            ))
-
-        # Check if subject is outside crop entirely
-        if subject_x_px < crop.x or subject_x_px > crop.right:
-            issues.append(CropIssue(
-                severity="error",
-                code="subject_outside_crop_x",
-                message="Subject is outside crop area horizontally",
-            ))
-
-        if subject_y_px < crop.y or subject_y_px > crop.bottom:
-            issues.append(CropIssue(
-                severity="error",
-                code="subject_outside_crop_y",
-                message="Subject is outside crop area vertically",
-            ))
-
-        return crop, issues
-
-    def _calculate_confidence(
+        subject_x_px = (subject_position.x * scaled_width).astype(np.int64)
+        subject_y_px = (subject_position.y * scaled_height).astype(np.int64)
+        head_y_px = (subject_position.head_y * scaled_height).astype(np.int64)
+
+        head_in_crop_y = head_y_px - y
+        min_top_margin = (self.HEAD_TOP_MARGIN * height).astype(np.int64)
+        max_bottom = height - caption_margins - 50  # Leave room for captions
+        subject_in_crop_x = subject_x_px - x
+        min_side_margin = (self.SIDE_MARGIN * width).astype(np.int64)
+        near_left = subject_in_crop_x < min_side_margin
+
+        flags = np.zeros(len(crops), dtype=np.uint16)
+        flags[head_in_crop_y < min_top_margin] |= ISSUE_HEAD_TOO_HIGH
+        flags[subject_y_px - y > max_bottom] |= ISSUE_SUBJECT_TOO_LOW
+        flags[near_left] |= ISSUE_SUBJECT_NEAR_LEFT
+        flags[~near_left & (subject_in_crop_x > width - min_side_margin)] |= ISSUE_SUBJECT_NEAR_RIGHT
+        flags[(subject_x_px < x) | (subject_x_px > x + width)] |= ISSUE_SUBJECT_OUTSIDE_X
+        flags[(subject_y_px < y) | (subject_y_px > y + height)] |= ISSUE_SUBJECT_OUTSIDE_Y
+
+        return flags, head_in_crop_y, min_top_margin
+
+    def _calculate_confidence_batch(
         self,
-        subject_position: Optional[SubjectPosition],
-        crop: CropRegion,
-        format_spec: FormatSpec,
-        issues: List[CropIssue],
-    ) -> float:
-        """Calculate overall confidence score (0-1)."""
-        if not subject_position:
-            return 0.0
-
-        # Start with subject detection confidence
-        score = subject_position.confidence
+        subject_position: SubjectPosition,
+        issue_flags: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized confidence scoring (as in _compute_result) per crop."""
+        score = np.full(len(issue_flags), subject_position.confidence, dtype=np.float64)
 
-        # Reduce for each issue
-        for issue in issues:
-            if issue.severity == "error":
-                score *= 0.5  # Major reduction for errors
-            elif issue.severity == "warning":
-                score *= 0.9  # Minor reduction for warnings
+        # Apply reductions in issue order so results match the scalar path
+        for bit, factor in _ISSUE_SCORE_FACTORS:
+            score[(issue_flags & bit) != 0] *= factor
 
-        # Bonus for subject being well-centered
         if subject_position.is_centered:
-            score = min(1.0, score * 1.05)
-
-        # Bonus for head being well-positioned
+            score = np.minimum(1.0, score * 1.05)
         if subject_position.head_in_frame:
-            score = min(1.0, score * 1.03)
+            score = np.minimum(1.0, score * 1.03)
 
-        return max(0.0, min(1.0, score))
+        return np.clip(score, 0.0, 1.0)
 
 
 def calculate_crop_for_video(
@@ -498,7 +719,7 @@ def calculate_crop_for_video(
     formats: Optional[List[ExportFormat]] = None,
     clip_start: Optional[float] = None,
     clip_end: Optional[float] = None,
-) -> MultiFormatCropResult:
+) -> MultiFormatCropResultSoA:
     """
     Calculate crops for a video file.
 
@@ -511,7 +732,7 @@ def calculate_crop_for_video(
         clip_end: Optional clip end time
 
     Returns:
-        MultiFormatCropResult
+        MultiFormatCropResultSoA
     """
     from src.video.frame_sampler import sample_frames, SamplingMode, get_video_info
     from src.video.vision_detector import QwenVisionDetector
@@ -544,9 +765,37 @@ def calculate_crop_for_video(
     )
 
 
-if __name__ == "__main__":
-    import json
+def calculate_crops_for_videos(
+    video_paths: List[str],
+    formats: Optional[List[ExportFormat]] = None,
+    max_workers: int = 4,
+) -> Dict[str, MultiFormatCropResultSoA]:
+    """
+    Calculate crops for several videos concurrently.
+
+    Each video's work is dominated by ffprobe/ffmpeg subprocesses and the
+    vision detector's HTTP calls, all of which release the GIL, so a thread
+    pool overlaps them. The crop math itself is a few NumPy ops per video.
 
+    Args:
+        video_paths: Paths to video files
+        formats: Specific formats to calculate
+        max_workers: Maximum number of videos processed at once
+
+    Returns:
+        Dict mapping each video path to its MultiFormatCropResultSoA
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(
+            lambda path: calculate_crop_for_video(path, formats=formats),
+            video_paths,
+        )
+        return dict(zip(video_paths, results))
+
+
+if __name__ == "__main__":
     print("Crop Calculator - Test Mode")
     print("=" * 60)
 
@@ -13,12 +13,26 @@ Usage:
     )
 """
 
-from dataclasses import dataclass
+import tempfile
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from math import floor, ceil
 
+import numpy as np
 
-@dataclass
+
+# Filter graphs above either limit are handed to FFmpeg via -filter_complex_script
+# instead of inline, to stay clear of the OS argument-length limit (ARG_MAX ~128 KB)
+FILTER_SCRIPT_SEGMENT_THRESHOLD = 200
+FILTER_SCRIPT_BYTES_THRESHOLD = 100_000
+
+# Plans with more segments than this render with a single select filter
+# instead of a split/trim/concat graph (one filter vs. 2N+2)
+SELECT_FILTER_SEGMENT_THRESHOLD = 8
+
+
+@dataclass(slots=True, frozen=True)
 class VideoEditSegment:
     """
     A segment of video to include in the final render.
@@ -52,29 +66,41 @@ class VideoEditSegment:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        start = self.start
+        end = self.end
         return {
-            "start": round(self.start, 6),
-            "end": round(self.end, 6),
-            "duration": round(self.duration, 6),
+            "start": round(start, 6),
+            "end": round(end, 6),
+            "duration": round(end - start, 6),
             "start_frame": self.start_frame,
             "end_frame": self.end_frame,
-            "frame_count": self.frame_count,
+            "frame_count": self.end_frame - self.start_frame,
             "action": self.action,
             "reason": self.reason,
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoEditPlan:
     """
     Complete plan for video editing.
 
     Contains all segments and metadata for rendering.
     """
-    segments: List[VideoEditSegment]
+    segments: Tuple[VideoEditSegment, ...]
     source_duration: float
     source_fps: float
     edited_duration: float
+    # Segment end times, for bisecting; None when segments aren't in time order
+    _segment_ends: Optional[List[float]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Stored as a tuple so the cached ends can't drift from the segments
+        object.__setattr__(self, "segments", tuple(self.segments))
+        ends = [seg.end for seg in self.segments]
+        starts_sorted = all(a.start <= b.start for a, b in zip(self.segments, self.segments[1:]))
+        ends_sorted = all(a <= b for a, b in zip(ends, ends[1:]))
+        object.__setattr__(self, "_segment_ends", ends if starts_sorted and ends_sorted else None)
 
     @property
     def segment_count(self) -> int:
@@ -121,25 +147,78 @@ class VideoEditPlan:
             seg = self.segments[0]
             return f"[{input_label}]{seg.to_ffmpeg_trim()}[{output_label}]"
 
-        # Multiple segments - split, trim each, concat
-        filters = []
-        segment_labels = []
-
-        # Split input into N streams
-        split_outputs = "".join(f"[s{i}]" for i in range(len(self.segments)))
-        filters.append(f"[{input_label}]split={len(self.segments)}{split_outputs}")
+        # Multiple segments - split, trim each, concat.
+        # Built as one flat list of fragments joined once; labels are base-36
+        # to keep the graph short for plans with thousands of segments.
+        n = len(self.segments)
+        labels = [_b36(i) for i in range(n)]
+        parts = [f"[{input_label}]split={n}"]
+        parts.extend(f"[s{label}]" for label in labels)
+        parts.append(";")
 
         # Trim each segment
-        for i, seg in enumerate(self.segments):
-            label = f"v{i}"
-            filters.append(f"[s{i}]{seg.to_ffmpeg_trim()}[{label}]")
-            segment_labels.append(f"[{label}]")
+        for label, seg in zip(labels, self.segments):
+            parts.append(
+                f"[s{label}]trim={seg.start:.6f}:{seg.end:.6f},setpts=PTS-STARTPTS[v{label}];"
+            )
 
         # Concat all segments
-        concat_inputs = "".join(segment_labels)
-        filters.append(f"{concat_inputs}concat=n={len(self.segments)}:v=1:a=0[{output_label}]")
+        parts.extend(f"[v{label}]" for label in labels)
+        parts.append(f"concat=n={n}:v=1:a=0[{output_label}]")
+
+        return "".join(parts)
+
+    def generate_ffmpeg_select_expr(self) -> str:
+        """
+        Generate a single video filter that keeps only the plan's segments.
 
-        return ";".join(filters)
+        Rather than splitting the stream N ways and concatenating, frames
+        outside the kept ranges are dropped and timestamps regenerated.
+        The filter graph stays one filter regardless of segment count.
+        Each range is [start, end), matching trim, so a segment keeps the
+        same frames either way.
+
+        Audio has no equivalent: aselect keeps or drops whole audio frames
+        (~1024 samples) and drifts from the video, so audio always uses
+        atrim + concat.
+
+        Returns: "select='gte(t,a)*lt(t,b)+...',setpts=N/FRAME_RATE/TB"
+        """
+        # Boundaries are nudged down 1us so a frame sitting exactly on a
+        # frame-snapped start/end lands on the same side as with trim,
+        # whatever the 6-decimal rounding did to the boundary
+        expr = "+".join(
+            f"gte(t,{seg.start - 1e-6:.6f})*lt(t,{seg.end - 1e-6:.6f})" for seg in self.segments
+        )
+        return f"select='{expr}',setpts=N/FRAME_RATE/TB"
+
+    @property
+    def prefers_select_filter(self) -> bool:
+        """Whether to render video with a select filter rather than split/concat."""
+        return len(self.segments) > SELECT_FILTER_SEGMENT_THRESHOLD
+
+    def write_filter_complex_script(
+        self,
+        path: str,
+        input_label: str = "0:v",
+        output_label: str = "outv",
+    ) -> str:
+        """
+        Write the filter_complex graph to a file for -filter_complex_script.
+
+        No shell escaping is needed since FFmpeg reads the file directly.
+
+        Args:
+            path: Destination file path
+            input_label: Input stream label
+            output_label: Output stream label
+
+        Returns:
+            The path written
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.generate_ffmpeg_filter_complex(input_label, output_label))
+        return path
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -153,6 +232,99 @@ class VideoEditPlan:
             "segments": [s.to_dict() for s in self.segments],
         }
 
+    def to_columnar_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a column-oriented dictionary for JSON serialization.
+
+        Same plan-level fields as to_dict(), but segments are emitted as
+        parallel arrays rather than one dict per segment. Rounding is done
+        once per column with NumPy, which keeps serialization of plans with
+        thousands of segments cheap and the JSON much smaller.
+        """
+        n = len(self.segments)
+        starts = np.fromiter((s.start for s in self.segments), dtype=np.float64, count=n)
+        ends = np.fromiter((s.end for s in self.segments), dtype=np.float64, count=n)
+        start_frames = np.fromiter((s.start_frame for s in self.segments), dtype=np.int64, count=n)
+        end_frames = np.fromiter((s.end_frame for s in self.segments), dtype=np.int64, count=n)
+
+        return {
+            "source_duration": round(self.source_duration, 3),
+            "source_fps": self.source_fps,
+            "edited_duration": round(self.edited_duration, 3),
+            "time_saved": round(self.time_saved, 3),
+            "reduction_percent": round(self.reduction_percent, 1),
+            "segment_count": n,
+            "segments": {
+                "start": np.round(starts, 6).tolist(),
+                "end": np.round(ends, 6).tolist(),
+                "duration": np.round(ends - starts, 6).tolist(),
+                "start_frame": start_frames.tolist(),
+                "end_frame": end_frames.tolist(),
+                "frame_count": (end_frames - start_frames).tolist(),
+                "action": [s.action for s in self.segments],
+                "reason": [s.reason for s in self.segments],
+            },
+        }
+
+
+_B36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _b36(i: int) -> str:
+    """Encode a non-negative int in base 36 (short FFmpeg stream labels)."""
+    if i < 36:
+        return _B36_DIGITS[i]
+    digits = []
+    while i:
+        i, rem = divmod(i, 36)
+        digits.append(_B36_DIGITS[rem])
+    return "".join(reversed(digits))
+
+
+def filter_complex_args(
+    filter_complex: str,
+    segment_count: int = 0,
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Build the FFmpeg arguments that pass a filter graph.
+
+    Small graphs are passed inline with -filter_complex. Large graphs (many
+    segments, or a string near the command-line size limit) are written to
+    a temp file and passed with -filter_complex_script; the caller is
+    responsible for deleting that file.
+
+    Args:
+        filter_complex: Complete filter graph
+        segment_count: Number of edit segments in the graph
+
+    Returns:
+        (ffmpeg_args, script_path) - script_path is None for inline graphs
+    """
+    if (
+        segment_count <= FILTER_SCRIPT_SEGMENT_THRESHOLD
+        and len(filter_complex) <= FILTER_SCRIPT_BYTES_THRESHOLD
+    ):
+        return ["-filter_complex", filter_complex], None
+
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        suffix=".filter",
+        delete=False,
+        encoding="utf-8",
+    ) as f:
+        f.write(filter_complex)
+        script_path = f.name
+
+    return ["-filter_complex_script", script_path], script_path
+
+
+# Rounding function per snap direction; unknown directions snap to nearest
+_SNAP = {
+    "floor": floor,
+    "ceil": ceil,
+    "nearest": round,
+}
+
 
 def snap_to_frame(
     time_seconds: float,
@@ -170,17 +342,8 @@ def snap_to_frame(
     Returns:
         (snapped_time, frame_number)
     """
-    frame_duration = 1.0 / fps
-
-    if direction == "floor":
-        frame_num = floor(time_seconds * fps)
-    elif direction == "ceil":
-        frame_num = ceil(time_seconds * fps)
-    else:  # nearest
-        frame_num = round(time_seconds * fps)
-
-    snapped_time = frame_num / fps
-    return (snapped_time, frame_num)
+    frame_num = _SNAP.get(direction, round)(time_seconds * fps)
+    return (frame_num / fps, frame_num)
 
 
 def audio_edits_to_video_segments(
@@ -211,49 +374,51 @@ def audio_edits_to_video_segments(
         if d.get("action") in ("keep", "trim")
     ]
 
-    # Sort by start time
-    keep_decisions.sort(key=lambda d: d.get("start", 0))
-
-    segments = []
-    edited_duration = 0.0
-
-    for decision in keep_decisions:
-        start = decision.get("start", 0)
-        end = decision.get("end", 0)
-        action = decision.get("action", "keep")
-        reason = decision.get("reason", "")
-
-        if snap_to_frames:
-            # Snap start to nearest frame (prefer including more)
-            snapped_start, start_frame = snap_to_frame(start, video_fps, "floor")
-            # Snap end to nearest frame (prefer including more)
-            snapped_end, end_frame = snap_to_frame(end, video_fps, "ceil")
-        else:
-            snapped_start = start
-            snapped_end = end
-            start_frame = int(start * video_fps)
-            end_frame = int(end * video_fps)
-
-        # Skip zero-duration segments
-        if snapped_end <= snapped_start:
-            continue
-
-        segment = VideoEditSegment(
-            start=snapped_start,
-            end=snapped_end,
+    n = len(keep_decisions)
+    starts = np.fromiter((d.get("start", 0) for d in keep_decisions), dtype=np.float64, count=n)
+    ends = np.fromiter((d.get("end", 0) for d in keep_decisions), dtype=np.float64, count=n)
+
+    # Sort by start time (stable, so ties keep their input order)
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = ends[order]
+
+    if snap_to_frames:
+        # Snap start down and end up to frame boundaries (prefer including more)
+        start_frames = np.floor(starts * video_fps).astype(np.int64)
+        end_frames = np.ceil(ends * video_fps).astype(np.int64)
+        snapped_starts = start_frames / video_fps
+        snapped_ends = end_frames / video_fps
+    else:
+        snapped_starts = starts
+        snapped_ends = ends
+        start_frames = (starts * video_fps).astype(np.int64)
+        end_frames = (ends * video_fps).astype(np.int64)
+
+    # Skip zero-duration segments
+    valid = np.flatnonzero(snapped_ends > snapped_starts)
+    kept = [keep_decisions[i] for i in order[valid].tolist()]
+
+    segments = [
+        VideoEditSegment(
+            start=start,
+            end=end,
             start_frame=start_frame,
             end_frame=end_frame,
-            action=action,
-            reason=reason,
+            action=decision.get("action", "keep"),
+            reason=decision.get("reason", ""),
         )
-        segments.append(segment)
-        edited_duration += segment.duration
-
-    # Merge overlapping/adjacent segments
-    segments = _merge_adjacent_segments(segments, video_fps)
+        for start, end, start_frame, end_frame, decision in zip(
+            snapped_starts[valid].tolist(),
+            snapped_ends[valid].tolist(),
+            start_frames[valid].tolist(),
+            end_frames[valid].tolist(),
+            kept,
+        )
+    ]
 
-    # Recalculate edited duration after merge
-    edited_duration = sum(s.duration for s in segments)
+    # Merge overlapping/adjacent segments (also totals the kept duration)
+    segments, edited_duration = _merge_adjacent_segments(segments, video_fps)
 
     # Determine source duration
     if video_duration is None and segments:
@@ -274,7 +439,7 @@ def _merge_adjacent_segments(
     segments: List[VideoEditSegment],
     fps: float,
     max_gap_frames: int = 2,
-) -> List[VideoEditSegment]:
+) -> Tuple[List[VideoEditSegment], float]:
     """
     Merge segments that are adjacent or slightly overlapping.
 
@@ -284,36 +449,75 @@ def _merge_adjacent_segments(
         max_gap_frames: Maximum gap (in frames) to merge
 
     Returns:
-        Merged list of segments
+        (merged list of segments, total duration of the merged segments)
     """
     if not segments:
-        return []
+        return [], 0.0
 
     max_gap = max_gap_frames / fps
     merged = []
-    current = segments[0]
+    total = 0.0
+
+    # Accumulate the run being merged as plain scalars; a segment is only
+    # constructed when a run is flushed.
+    first = segments[0]
+    cur_start = first.start
+    cur_end = first.end
+    cur_start_frame = first.start_frame
+    cur_end_frame = first.end_frame
+    cur_action = first.action
+    cur_reasons = [first.reason]
 
     for next_seg in segments[1:]:
         # Check if segments should be merged
-        gap = next_seg.start - current.end
-
-        if gap <= max_gap:
-            # Merge: extend current to include next
-            current = VideoEditSegment(
-                start=current.start,
-                end=max(current.end, next_seg.end),
-                start_frame=current.start_frame,
-                end_frame=max(current.end_frame, next_seg.end_frame),
-                action="keep",
-                reason=f"merged: {current.reason} + {next_seg.reason}",
-            )
+        if next_seg.start - cur_end <= max_gap:
+            # Merge: extend current run to include next
+            if next_seg.end > cur_end:
+                cur_end = next_seg.end
+            if next_seg.end_frame > cur_end_frame:
+                cur_end_frame = next_seg.end_frame
+            cur_reasons.append(next_seg.reason)
         else:
-            # No merge: save current and start new
-            merged.append(current)
-            current = next_seg
-
-    merged.append(current)
-    return merged
+            # No merge: flush current run and start new
+            merged.append(_flush_merged_run(
+                cur_start, cur_end, cur_start_frame, cur_end_frame, cur_action, cur_reasons,
+            ))
+            total += cur_end - cur_start
+            cur_start = next_seg.start
+            cur_end = next_seg.end
+            cur_start_frame = next_seg.start_frame
+            cur_end_frame = next_seg.end_frame
+            cur_action = next_seg.action
+            cur_reasons = [next_seg.reason]
+
+    merged.append(_flush_merged_run(
+        cur_start, cur_end, cur_start_frame, cur_end_frame, cur_action, cur_reasons,
+    ))
+    total += cur_end - cur_start
+    return merged, total
+
+
+def _flush_merged_run(
+    start: float,
+    end: float,
+    start_frame: int,
+    end_frame: int,
+    action: str,
+    reasons: List[str],
+) -> VideoEditSegment:
+    """Build the output segment for a run of merged segments."""
+    if len(reasons) == 1:
+        return VideoEditSegment(start, end, start_frame, end_frame, action, reasons[0])
+
+    # Same text as merging pairwise: "merged: merged: a + b + c"
+    return VideoEditSegment(
+        start=start,
+        end=end,
+        start_frame=start_frame,
+        end_frame=end_frame,
+        action="keep",
+        reason="merged: " * (len(reasons) - 1) + " + ".join(reasons),
+    )
 
 
 def create_edit_plan_from_silence_result(
@@ -361,27 +565,40 @@ def apply_clip_range(
     """
     new_segments = []
     clip_duration = clip_end - clip_start
+    fps = edit_plan.source_fps
+    segments = edit_plan.segments
+    edited_duration = 0.0
 
-    for seg in edit_plan.segments:
-        # Skip segments entirely outside clip range
-        if seg.end <= clip_start or seg.start >= clip_end:
+    # For time-ordered plans, skip straight past segments ending at or
+    # before clip_start and stop at the first one starting after clip_end
+    ends = edit_plan._segment_ends
+    first = bisect_right(ends, clip_start) if ends is not None else 0
+
+    for i in range(first, len(segments)):
+        seg = segments[i]
+        seg_start = seg.start
+        if seg_start >= clip_end:
+            if ends is not None:
+                break
+            continue
+        seg_end = seg.end
+        if seg_end <= clip_start:
             continue
 
-        # Clamp segment to clip range
-        new_start = max(seg.start, clip_start) - clip_start  # Relative to clip start
-        new_end = min(seg.end, clip_end) - clip_start
+        # Clamp segment to clip range, relative to clip start
+        new_start = (seg_start if seg_start > clip_start else clip_start) - clip_start
+        new_end = (seg_end if seg_end < clip_end else clip_end) - clip_start
 
         if new_end > new_start:
             new_segments.append(VideoEditSegment(
                 start=new_start,
                 end=new_end,
-                start_frame=int(new_start * edit_plan.source_fps),
-                end_frame=int(new_end * edit_plan.source_fps),
+                start_frame=int(new_start * fps),
+                end_frame=int(new_end * fps),
                 action=seg.action,
                 reason=seg.reason,
             ))
-
-    edited_duration = sum(s.duration for s in new_segments)
+            edited_duration += new_end - new_start
 
     return VideoEditPlan(
         segments=new_segments,
@@ -14,6 +14,7 @@ Usage:
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Tuple, Optional, Union, List
 
 
@@ -114,19 +115,28 @@ class FormatSpec:
         Returns:
             (scaled_width, scaled_height) that covers target
         """
-        source_aspect = source_width / source_height
-        target_aspect = self.width / self.height
+        return _scale_for_source(source_width, source_height, self.width, self.height)
 
-        if source_aspect > target_aspect:
-            # Source is wider - scale by height
-            scaled_height = self.height
-            scaled_width = int(source_width * (self.height / source_height))
-        else:
-            # Source is taller - scale by width
-            scaled_width = self.width
-            scaled_height = int(source_height * (self.width / source_width))
 
-        return (scaled_width, scaled_height)
+@lru_cache(maxsize=256)
+def _scale_for_source(
+    source_width: int,
+    source_height: int,
+    target_width: int,
+    target_height: int,
+) -> Tuple[int, int]:
+    """Cached body of FormatSpec.scale_for_source (pure in its int inputs)."""
+    # Compare aspect ratios by cross-multiplying - exact, no division
+    if source_width * target_height > target_width * source_height:
+        # Source is wider - scale by height
+        scaled_height = target_height
+        scaled_width = (source_width * target_height) // source_height
+    else:
+        # Source is taller - scale by width
+        scaled_width = target_width
+        scaled_height = (source_height * target_width) // source_width
+
+    return (scaled_width, scaled_height)
 
 
 # Platform format specifications
@@ -236,6 +246,15 @@ FORMAT_SPECS = {
 }
 
 
+# Single lookup table keyed by both ExportFormat members and their string values
+_FORMAT_LOOKUP = {**FORMAT_SPECS, **{fmt.value: spec for fmt, spec in FORMAT_SPECS.items()}}
+
+# Constant subset returned by get_vertical_formats()
+_VERTICAL_FORMATS: Tuple[FormatSpec, ...] = tuple(
+    spec for spec in FORMAT_SPECS.values() if spec.aspect_ratio == ASPECT_9_16
+)
+
+
 def get_format(format_name: Union[ExportFormat, str]) -> FormatSpec:
     """
     Get format specification by name or enum.
@@ -249,17 +268,16 @@ def get_format(format_name: Union[ExportFormat, str]) -> FormatSpec:
     Raises:
         ValueError: If format not found
     """
-    if isinstance(format_name, str):
-        try:
-            format_name = ExportFormat(format_name.lower())
-        except ValueError:
-            available = [f.value for f in ExportFormat]
-            raise ValueError(f"Unknown format '{format_name}'. Available: {available}")
-
-    if format_name not in FORMAT_SPECS:
-        raise ValueError(f"No specification for format: {format_name}")
+    key = format_name.lower() if isinstance(format_name, str) else format_name
+    try:
+        return _FORMAT_LOOKUP[key]
+    except (KeyError, TypeError):
+        pass
 
-    return FORMAT_SPECS[format_name]
+    if isinstance(format_name, str):
+        available = [f.value for f in ExportFormat]
+        raise ValueError(f"Unknown format '{format_name}'. Available: {available}")
+    raise ValueError(f"No specification for format: {format_name}")
 
 
 def get_all_formats() -> List[FormatSpec]:
@@ -269,7 +287,7 @@ def get_all_formats() -> List[FormatSpec]:
 
 def get_vertical_formats() -> List[FormatSpec]:
     """Return formats with 9:16 aspect ratio (TikTok, Shorts, Reels)."""
-    return [spec for spec in FORMAT_SPECS.values() if spec.aspect_ratio == ASPECT_9_16]
+    return list(_VERTICAL_FORMATS)
 
 
 def calculate_crop_region(
@@ -297,19 +315,52 @@ def calculate_crop_region(
             - height: Crop height
             - scale: Scale factor applied
     """
-    source_aspect = source_width / source_height
-    target_aspect = target_format.width / target_format.height
+    x, y, width, height, scale, scaled_source = _calculate_crop_region(
+        source_width,
+        source_height,
+        target_format.width,
+        target_format.height,
+        target_format.subject_head_position,
+        subject_x,
+        subject_y,
+    )
+    return {
+        "x": x,
+        "y": y,
+        "width": width,
+        "height": height,
+        "scale": scale,
+        "scaled_source": scaled_source,
+    }
+
+
+@lru_cache(maxsize=256)
+def _calculate_crop_region(
+    source_width: int,
+    source_height: int,
+    target_width: int,
+    target_height: int,
+    subject_head_position: float,
+    subject_x: float,
+    subject_y: float,
+) -> Tuple[int, int, int, int, float, Tuple[int, int]]:
+    """
+    Cached body of calculate_crop_region.
 
-    if source_aspect > target_aspect:
+    Keyed only on the values the calculation reads, so every clip from the
+    same camera into the same format after the first is a dict lookup.
+    """
+    # Compare aspect ratios by cross-multiplying - exact, no division
+    if source_width * target_height > target_width * source_height:
         # Source is wider than target - crop sides
         # Scale source to match target height
-        scale = target_format.height / source_height
+        scale = target_height / source_height
         scaled_width = int(source_width * scale)
-        scaled_height = target_format.height
+        scaled_height = target_height
 
         # Calculate crop width (same as target)
-        crop_width = target_format.width
-        crop_height = target_format.height
+        crop_width = target_width
+        crop_height = target_height
 
         # Center crop on subject
         subject_x_px = int(subject_x * scaled_width)
@@ -321,17 +372,17 @@ def calculate_crop_region(
     else:
         # Source is taller than target - crop top/bottom
         # Scale source to match target width
-        scale = target_format.width / source_width
-        scaled_width = target_format.width
+        scale = target_width / source_width
+        scaled_width = target_width
         scaled_height = int(source_height * scale)
 
-        crop_width = target_format.width
-        crop_height = target_format.height
+        crop_width = target_width
+        crop_height = target_height
 
         # Position based on target head position
         # subject_y is where subject's head is in source (0-1)
         # target head position is where we want it in output
-        target_head_y = int(target_format.subject_head_position * crop_height)
+        target_head_y = int(subject_head_position * crop_height)
         subject_y_px = int(subject_y * scaled_height)
 
         # Calculate crop_y to put subject's head at target position
@@ -341,14 +392,8 @@ def calculate_crop_region(
         crop_y = max(0, min(crop_y, scaled_height - crop_height))
         crop_x = 0
 
-    return {
-        "x": crop_x,
-        "y": crop_y,
-        "width": crop_width,
-        "height": crop_height,
-        "scale": scale,
-        "scaled_source": (int(source_width * scale), int(source_height * scale)),
-    }
+    scaled_source = (int(source_width * scale), int(source_height * scale))
+    return (crop_x, crop_y, crop_width, crop_height, scale, scaled_source)
 
 
 if __name__ == "__main__":
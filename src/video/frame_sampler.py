@@ -3,6 +3,7 @@ Frame sampling from video files using FFmpeg.
 
 Extracts frames at specific timestamps for vision AI analysis.
 Supports sparse mode (5 key frames) and dense mode (1fps).
+Decodes in-process with PyAV when installed, otherwise via the FFmpeg CLI.
 
 Usage:
     from src.video.frame_sampler import sample_frames, SamplingMode
@@ -15,14 +16,33 @@ Usage:
 """
 
 import os
+import re
+import shutil
 import subprocess
 import tempfile
 import base64
-from dataclasses import dataclass
+import json
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson  # Optional: faster parsing of ffprobe's JSON output
+except ImportError:
+    orjson = None
+
+try:
+    import av  # Optional: in-process decoding instead of one FFmpeg call per sample
+except ImportError:
+    av = None
+
 
 class SamplingMode(Enum):
     """Frame sampling modes."""
@@ -31,7 +51,7 @@ class SamplingMode(Enum):
     CUSTOM = "custom"    # User-specified timestamps
 
 
-@dataclass
+@dataclass(slots=True)
 class SampledFrame:
     """A single sampled frame from video."""
     timestamp: float       # Timestamp in seconds
@@ -40,11 +60,15 @@ class SampledFrame:
     height: int           # Frame height in pixels
     jpeg_bytes: bytes     # JPEG-encoded frame data
     file_path: Optional[str] = None  # Path if saved to disk
+    _b64: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def base64(self) -> str:
-        """Return frame as base64-encoded string for API calls."""
-        return base64.b64encode(self.jpeg_bytes).decode('utf-8')
+        """Return frame as base64-encoded string for API calls (computed once)."""
+        if self._b64 is None:
+            # base64 output is pure ASCII, so skip UTF-8 validation
+            self._b64 = base64.b64encode(self.jpeg_bytes).decode('ascii')
+        return self._b64
 
     @property
     def data_url(self) -> str:
@@ -57,7 +81,10 @@ class SampledFrame:
         return len(self.jpeg_bytes) / 1024
 
 
-@dataclass
+_frame_timestamp = attrgetter("timestamp")
+
+
+@dataclass(slots=True)
 class SamplingResult:
     """Result of frame sampling operation."""
     video_path: str
@@ -66,7 +93,22 @@ class SamplingResult:
     height: int
     fps: float
     mode: SamplingMode
-    frames: List[SampledFrame]
+    frames: Tuple[SampledFrame, ...]
+    # Frames sorted by timestamp, with their timestamps, for get_frame_at
+    _sorted_frames: Optional[List[SampledFrame]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _timestamps: Optional[List[float]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    # The frames sequence the index was built from
+    _indexed_frames: Optional[Tuple[SampledFrame, ...]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self):
+        # Stored as a tuple so the get_frame_at index can't drift from it
+        self.frames = tuple(self.frames)
 
     @property
     def total_size_kb(self) -> float:
@@ -74,23 +116,61 @@ class SamplingResult:
         return sum(f.size_kb for f in self.frames)
 
     def get_frame_at(self, timestamp: float, tolerance: float = 0.5) -> Optional[SampledFrame]:
-        """Get frame closest to given timestamp within tolerance."""
-        for frame in self.frames:
-            if abs(frame.timestamp - timestamp) <= tolerance:
-                return frame
-        return None
+        """
+        Get frame closest to given timestamp within tolerance.
+
+        Binary-searches a timestamp index built on first use; ties go to the
+        earlier frame. The index is rebuilt if frames is reassigned.
+        """
+        frames = self.frames
+        if frames is not self._indexed_frames or len(frames) != len(self._timestamps):
+            self._sorted_frames = sorted(frames, key=_frame_timestamp)
+            self._timestamps = [f.timestamp for f in self._sorted_frames]
+            self._indexed_frames = frames
+
+        i = bisect_left(self._timestamps, timestamp)
+        best = None
+        best_distance = tolerance
+        # Only the neighbours either side of the insertion point can be closest
+        for j in (i - 1, i):
+            if 0 <= j < len(self._timestamps):
+                distance = abs(self._timestamps[j] - timestamp)
+                if distance <= best_distance and (best is None or distance < best_distance):
+                    best = self._sorted_frames[j]
+                    best_distance = distance
+        return best
 
 
 def get_video_info(video_path: str) -> Dict[str, Any]:
     """
     Get video metadata using ffprobe.
 
+    Results are cached per file; the cache key includes the file's size and
+    modification time, so a rewritten file is probed again.
+
     Args:
         video_path: Path to video file
 
     Returns:
         Dictionary with duration, resolution, fps
     """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return _probe_video_info(video_path)
+
+    info = _get_video_info_cached(os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+    return dict(info)
+
+
+@lru_cache(maxsize=256)
+def _get_video_info_cached(abspath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Cached ffprobe lookup keyed on path, mtime and size."""
+    return _probe_video_info(abspath)
+
+
+def _probe_video_info(video_path: str) -> Dict[str, Any]:
+    """Run ffprobe and parse duration, resolution, fps and codec."""
     cmd = [
         "ffprobe",
         "-v", "quiet",
@@ -100,13 +180,17 @@ def get_video_info(video_path: str) -> Dict[str, Any]:
         video_path,
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Keep stdout as bytes; both parsers read UTF-8 bytes directly
+    result = subprocess.run(cmd, capture_output=True)
 
     if result.returncode != 0:
-        raise RuntimeError(f"ffprobe failed: {result.stderr}")
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"ffprobe failed: {stderr}")
 
-    import json
-    data = json.loads(result.stdout)
+    if orjson is not None:
+        data = orjson.loads(result.stdout)
+    else:
+        data = json.loads(result.stdout)
 
     format_info = data.get("format", {})
     streams = data.get("streams", [])
@@ -164,7 +248,7 @@ def _extract_frame_at_timestamp(
         output_path,
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return result.returncode == 0 and os.path.exists(output_path)
 
 
@@ -209,15 +293,451 @@ def _calculate_dense_timestamps(duration: float, fps: float = 1.0) -> List[float
     if duration <= 0:
         return []
 
-    interval = 1.0 / fps
-    timestamps = []
-    t = 0.5  # Start slightly offset
+    # Start slightly offset; arange's length is computed in floating point,
+    # so trim anything that lands on or past the end bound
+    end = duration - 0.5
+    timestamps = np.arange(0.5, end, 1.0 / fps)
+    return timestamps[timestamps < end].tolist()
+
+
+# Largest gap between consecutive timestamps for which decoding straight
+# through is cheaper than spawning a seeking FFmpeg process per frame
+BATCH_MAX_GAP_SECONDS = 2.0
+
+
+def _should_batch(sample_times: List[float]) -> bool:
+    """Whether to extract all timestamps in one FFmpeg pass."""
+    if len(sample_times) < 2:
+        return False
+    ordered = sorted(sample_times)
+    return all(b - a <= BATCH_MAX_GAP_SECONDS for a, b in zip(ordered, ordered[1:]))
+
+
+# JPEG start-of-frame markers (baseline, progressive, etc.). C4, C8 and CC
+# share the range but are DHT, JPG and DAC segments.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_dims(jpeg_bytes: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read width and height from a JPEG's start-of-frame header.
+
+    Walks the marker segments after SOI until the SOF segment, which sits
+    within the first few KB of the file.
+
+    Returns:
+        (width, height), or None if no SOF header is found
+    """
+    i = 2
+    size = len(jpeg_bytes)
+    while i + 9 <= size:
+        if jpeg_bytes[i] != 0xFF:
+            return None
+        marker = jpeg_bytes[i + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            i += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height = (jpeg_bytes[i + 5] << 8) | jpeg_bytes[i + 6]
+            width = (jpeg_bytes[i + 7] << 8) | jpeg_bytes[i + 8]
+            return width, height
+        i += 2 + ((jpeg_bytes[i + 2] << 8) | jpeg_bytes[i + 3])
+    return None
+
+
+def _split_jpeg_stream(data: bytes) -> List[bytes]:
+    """
+    Split concatenated JPEGs (FFmpeg image2pipe output) into single images.
+
+    Header segments are skipped by their length fields and the entropy-coded
+    data is scanned for the EOI marker, so FF D9 byte pairs inside headers
+    or tables cannot end an image early.
+    """
+    images = []
+    size = len(data)
+    start = data.find(b"\xff\xd8")
+    while start != -1:
+        # Walk header segments up to start-of-scan
+        i = start + 2
+        while i + 4 <= size and data[i] == 0xFF:
+            marker = data[i + 1]
+            if marker == 0xFF:
+                i += 1
+                continue
+            i += 2 + ((data[i + 2] << 8) | data[i + 3])
+            if marker == 0xDA:
+                break
+
+        # In scan data, FF is followed by 00 (stuffing) or RST0-7 unless it
+        # starts a marker; the first other marker here is EOI
+        while True:
+            i = data.find(b"\xff", i)
+            if i == -1 or i + 1 >= size:
+                return images
+            follower = data[i + 1]
+            if follower == 0x00 or 0xD0 <= follower <= 0xD7:
+                i += 2
+                continue
+            if follower == 0xD9:
+                break
+            if i + 4 > size:
+                return images
+            # Another marker (e.g. DHT/SOS in progressive JPEGs): skip it
+            i += 2 + ((data[i + 2] << 8) | data[i + 3])
+
+        end = i + 2
+        images.append(data[start:end])
+        start = data.find(b"\xff\xd8", end)
+
+    return images
+
+
+# -hwaccel_output_format for decoders that can keep frames in device memory;
+# those frames are downloaded with hwdownload,format=nv12 before encoding.
+# Other accelerators hand back system-memory frames on their own.
+_HWACCEL_OUTPUT_FORMATS = {
+    "cuda": "cuda",
+    "qsv": "qsv",
+    "videotoolbox": "videotoolbox_vld",
+}
+
+
+@lru_cache(maxsize=1)
+def _available_hwaccels() -> frozenset:
+    """Hardware decoders this FFmpeg build supports (`ffmpeg -hwaccels`)."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return frozenset()
+    if result.returncode != 0:
+        return frozenset()
+    # First line is the "Hardware acceleration methods:" header
+    return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+
 
-    while t < duration - 0.5:
-        timestamps.append(t)
-        t += interval
+def _hwaccel_args(hwaccel: Optional[str]) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """
+    FFmpeg input options and download filter for a hardware decoder.
 
-    return timestamps
+    Returns:
+        (input_args, download_filter); ((), None) if hwaccel is None or not
+        supported by the installed FFmpeg, so decoding stays on the CPU
+    """
+    if not hwaccel or hwaccel not in _available_hwaccels():
+        return (), None
+    output_format = _HWACCEL_OUTPUT_FORMATS.get(hwaccel)
+    if output_format is None:
+        return ("-hwaccel", hwaccel), None
+    return (
+        ("-hwaccel", hwaccel, "-hwaccel_output_format", output_format),
+        "hwdownload,format=nv12",
+    )
+
+
+def _extract_frames_seeking(
+    video_path: str,
+    sample_times: List[float],
+    temp_dir: str,
+    quality: int,
+    output_filter: Optional[str],
+    hwaccel_args: Tuple[str, ...] = (),
+) -> List[Tuple[int, float, bytes, str]]:
+    """
+    Extract each timestamp with its own seeking FFmpeg call.
+
+    Best for a few timestamps spread across a long video, where decoding
+    the stretches in between would cost more than the extra processes.
+
+    output_filter is the -vf chain applied to the extracted frame, and
+    hwaccel_args are decoder options placed before -i.
+
+    Returns:
+        List of (index, timestamp, jpeg_bytes, output_path) for successful
+        extractions
+    """
+    # Only the seek time and output path vary between calls
+    input_args = (*hwaccel_args, "-i", video_path, "-vframes", "1", "-q:v", str(quality))
+    if output_filter:
+        input_args += ("-vf", output_filter)
+
+    def extract_one(idx: int, timestamp: float) -> Optional[Tuple[int, float, bytes, str]]:
+        output_path = os.path.join(temp_dir, f"frame_{idx:04d}.jpg")
+        cmd = ("ffmpeg", "-y", "-ss", str(timestamp), *input_args, output_path)
+
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        if result.returncode == 0 and os.path.exists(output_path):
+            return idx, timestamp, Path(output_path).read_bytes(), output_path
+        return None
+
+    if len(sample_times) < 2:
+        results = [extract_one(idx, t) for idx, t in enumerate(sample_times)]
+    else:
+        # Each extraction is an independent FFmpeg process, so they can run
+        # side by side; map() keeps results in timestamp order
+        workers = min(len(sample_times), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(extract_one, range(len(sample_times)), sample_times))
+
+    return [r for r in results if r is not None]
+
+
+# showinfo's per-frame log line and its input time base
+_SHOWINFO_PTS_RE = re.compile(rb"\[Parsed_showinfo_\d+ @ [^\]]*\] n:\s*\d+ pts:\s*(-?\d+)")
+_SHOWINFO_TIME_BASE_RE = re.compile(rb"\[Parsed_showinfo_\d+ @ [^\]]*\] config in time_base: (\d+)/(\d+)")
+
+
+def _select_times_expr(times: List[float]) -> str:
+    """
+    Build a select filter expression keeping the first frame at or after
+    each of the given sorted times (in seconds).
+
+    A frame is kept when a sample time falls in (prev_t, t], which works
+    for variable-frame-rate video. Evenly spaced times (DENSE mode) become
+    a single count of samples passed, so the expression costs the same per
+    decoded frame however many samples are taken. Other lists fall back to
+    one term per time.
+
+    Times are compared with one time base unit (TB) of slack: after an
+    input seek FFmpeg shifts timestamps by the -ss offset rounded to the
+    stream time base, e.g. to the millisecond for Matroska.
+    """
+    if len(times) > 2:
+        first = times[0]
+        step = times[1] - first
+        if step > 1e-3 and all(
+            abs((b - a) - step) <= 1e-6 for a, b in zip(times[1:], times[2:])
+        ):
+            # Number of samples at or before x
+            def passed(x: str) -> str:
+                return f"clip(floor(({x}-{first:.6f}+TB)/{step:.6f})+1,0,{len(times)})"
+
+            return f"gt({passed('t')},if(isnan(prev_t),0,{passed('prev_t')}))"
+    return "+".join(
+        f"gte(t,{t:.6f}-TB)*not(gte(prev_t,{t:.6f}-TB))" for t in times
+    )
+
+
+def _extract_frames_batched(
+    video_path: str,
+    sample_times: List[float],
+    output_dir: Optional[str],
+    quality: int,
+    output_filter: Optional[str],
+    hwaccel_args: Tuple[str, ...] = (),
+) -> List[Tuple[int, float, bytes, Optional[str]]]:
+    """
+    Extract all timestamps in a single FFmpeg call using the select filter.
+
+    Seeks once to the earliest timestamp, decodes through to the latest and
+    keeps only the requested frames. Each timestamp maps to the first frame
+    at or after it, the same frame a seeking extraction would return.
+    Frames are chosen by timestamp, and showinfo reports the time of each
+    one kept, so variable-frame-rate video maps correctly too.
+
+    With no output_dir the JPEGs are streamed over stdout and never touch
+    the filesystem. output_filter runs after selection, so with hardware
+    decoding only the selected frames are downloaded.
+
+    Returns:
+        List of (index, timestamp, jpeg_bytes, output_path) for successful
+        extractions; output_path is None when streamed
+    """
+    first = min(sample_times)
+    last = max(sample_times)
+
+    # Frame times restart at 0 after the input seek
+    relative_times = sorted(set(t - first for t in sample_times))
+
+    vf = f"select='{_select_times_expr(relative_times)}'"
+    if output_filter:
+        vf = f"{vf},{output_filter}"
+    vf = f"{vf},showinfo"
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-nostats",
+        "-ss", str(first),
+        # A second past the last sample reaches its frame even at low or
+        # variable frame rates
+        "-t", str(last - first + 1.0),
+        *hwaccel_args,
+        "-i", video_path,
+        "-vf", vf,
+        "-vsync", "vfr",
+        "-q:v", str(quality),
+    ]
+
+    # Outputs come out in frame order
+    if output_dir:
+        cmd.extend(["-start_number", "0", os.path.join(output_dir, "frame_%04d.jpg")])
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        paths = []
+        while True:
+            output_path = os.path.join(output_dir, f"frame_{len(paths):04d}.jpg")
+            if not os.path.exists(output_path):
+                break
+            paths.append(output_path)
+        images = [Path(path).read_bytes() for path in paths]
+    else:
+        cmd.extend(["-f", "image2pipe", "-vcodec", "mjpeg", "-"])
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        images = _split_jpeg_stream(result.stdout)
+        paths = [None] * len(images)
+
+    # Time of each kept frame, in output order
+    time_base = _SHOWINFO_TIME_BASE_RE.search(result.stderr)
+    if time_base is None:
+        return []
+    tb = int(time_base.group(1)) / int(time_base.group(2))
+    frame_times = [int(pts) * tb for pts in _SHOWINFO_PTS_RE.findall(result.stderr)]
+    kept = min(len(frame_times), len(images))
+
+    extracted = []
+    for idx, timestamp in enumerate(sample_times):
+        # Every sample's frame was kept, so the first kept frame at or
+        # after the sample is its frame
+        i = bisect_left(frame_times, timestamp - first - tb, 0, kept)
+        if i < kept:
+            extracted.append((idx, timestamp, images[i], paths[i]))
+
+    return extracted
+
+
+def _scaled_dims(width: int, height: int, max_dimension: int) -> Tuple[int, int]:
+    """
+    Output size of the scale filter sample_frames uses (scale=N:-2 / -2:N).
+
+    The free side is rescaled with round-half-up and snapped to an even
+    number, the same way FFmpeg evaluates -2.
+    """
+    if not max_dimension or (width <= max_dimension and height <= max_dimension):
+        return width, height
+    if width >= height:
+        return max_dimension, (max_dimension * height + width) // (2 * width) * 2
+    return (max_dimension * width + height) // (2 * height) * 2, max_dimension
+
+
+def _extract_frames_pyav(
+    video_path: str,
+    sample_times: List[float],
+    quality: int,
+    size: Tuple[int, int],
+    output_dir: Optional[str],
+) -> Optional[List[Tuple[int, float, bytes, Optional[str]]]]:
+    """
+    Extract frames in-process with PyAV, opening the container once.
+
+    Timestamps are visited in ascending order. Nearby samples decode forward
+    from the current position; a seek is only issued when the next sample
+    is more than BATCH_MAX_GAP_SECONDS ahead. Each timestamp maps to the
+    first frame at or after it, as with the FFmpeg CLI, and frames are
+    encoded with FFmpeg's own MJPEG encoder at the same -q:v quality.
+
+    Args:
+        video_path: Path to video file
+        sample_times: Timestamps to extract
+        quality: JPEG quality (2-31, lower is better)
+        size: Output (width, height)
+        output_dir: Also write frame_NNNN.jpg files here if given
+
+    Returns:
+        List of (index, timestamp, jpeg_bytes, output_path), or None if the
+        file could not be decoded or carries rotation metadata (callers fall
+        back to the FFmpeg CLI)
+    """
+    out_width, out_height = size
+    extracted = []
+
+    try:
+        with av.open(video_path) as container:
+            if not container.streams.video:
+                return None
+            stream = container.streams.video[0]
+            # Older FFmpeg builds report rotation as a stream tag
+            if stream.metadata.get("rotate", "0") not in ("0", ""):
+                return None
+            stream.thread_type = "AUTO"
+
+            # The CLI's -ss is relative to the file's start time, while
+            # frame.time is absolute; shift sample times to match
+            if container.start_time is not None:
+                start_offset = container.start_time / av.time_base
+            elif stream.start_time is not None:
+                start_offset = float(stream.start_time * stream.time_base)
+            else:
+                start_offset = 0.0
+
+            encoder = av.CodecContext.create("mjpeg", "w")
+            encoder.width = out_width
+            encoder.height = out_height
+            encoder.pix_fmt = "yuvj420p"
+            encoder.time_base = stream.time_base
+            # Pin the quantizer, matching -q:v
+            encoder.qmin = quality
+            encoder.qmax = quality
+
+            decoded = None
+            current = None
+            jpeg_bytes = None
+            order = sorted(range(len(sample_times)), key=sample_times.__getitem__)
+
+            for idx in order:
+                timestamp = sample_times[idx]
+                target = timestamp + start_offset
+
+                # Samples are ascending, so a frame at or after this one's
+                # time is also the first frame at or after it
+                if current is None or current.time < target - 1e-6:
+                    if current is None or target - current.time > BATCH_MAX_GAP_SECONDS:
+                        container.seek(
+                            int(target / stream.time_base),
+                            stream=stream,
+                            backward=True,
+                            any_frame=False,
+                        )
+                        decoded = container.decode(stream)
+                    jpeg_bytes = None
+                    current = next(
+                        (f for f in decoded if f.time is not None and f.time >= target - 1e-6),
+                        None,
+                    )
+                    if current is None:
+                        # Past the end of the stream
+                        break
+                    if getattr(current, "rotation", 0):
+                        # The CLI autorotates display-matrix video (phone
+                        # portrait clips); leave those to it
+                        return None
+
+                if jpeg_bytes is None:
+                    frame = current.reformat(
+                        width=out_width,
+                        height=out_height,
+                        format="yuvj420p",
+                        interpolation="BICUBIC",
+                    )
+                    frame.pts = None
+                    jpeg_bytes = b"".join(bytes(p) for p in encoder.encode(frame))
+
+                output_path = None
+                if output_dir:
+                    output_path = os.path.join(output_dir, f"frame_{idx:04d}.jpg")
+                    Path(output_path).write_bytes(jpeg_bytes)
+
+                extracted.append((idx, timestamp, jpeg_bytes, output_path))
+    except av.error.FFmpegError:
+        return None
+
+    extracted.sort()
+    return extracted
 
 
 def sample_frames(
@@ -230,6 +750,7 @@ def sample_frames(
     quality: int = 2,
     keep_files: bool = False,
     output_dir: Optional[str] = None,
+    hwaccel: Optional[str] = None,
 ) -> SamplingResult:
     """
     Sample frames from a video file.
@@ -244,6 +765,9 @@ def sample_frames(
         quality: JPEG quality (2-31, lower is better)
         keep_files: Keep extracted frame files (otherwise temp files deleted)
         output_dir: Directory for output files (uses temp if None)
+        hwaccel: FFmpeg hardware decoder to use, e.g. "cuda", "videotoolbox"
+            or "qsv". Ignored if the installed FFmpeg doesn't support it.
+            Forces the FFmpeg CLI path instead of PyAV.
 
     Returns:
         SamplingResult with extracted frames
@@ -286,80 +810,66 @@ def sample_frames(
         else:
             scale_filter = f"scale=-2:{max_dimension}"
 
-    # Create output directory
-    if keep_files and output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-        temp_dir = output_dir
-        cleanup_temp = False
-    else:
-        temp_dir = tempfile.mkdtemp(prefix="frames_")
-        cleanup_temp = not keep_files
-
     frames = []
+    temp_dir = None
+    cleanup_temp = False
     try:
-        for idx, timestamp in enumerate(sample_times):
-            output_path = os.path.join(temp_dir, f"frame_{idx:04d}.jpg")
-
-            # Build FFmpeg command
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-ss", str(timestamp),
-                "-i", video_path,
-                "-vframes", "1",
-                "-q:v", str(quality),
-            ]
-
-            if scale_filter:
-                cmd.extend(["-vf", scale_filter])
-
-            cmd.append(output_path)
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            if result.returncode == 0 and os.path.exists(output_path):
-                # Read frame data
-                with open(output_path, "rb") as f:
-                    jpeg_bytes = f.read()
-
-                # Get actual frame dimensions (may be scaled)
-                probe_cmd = [
-                    "ffprobe", "-v", "quiet",
-                    "-select_streams", "v:0",
-                    "-show_entries", "stream=width,height",
-                    "-of", "csv=p=0",
-                    output_path,
-                ]
-                probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-                if probe_result.returncode == 0:
-                    dims = probe_result.stdout.strip().split(",")
-                    frame_width = int(dims[0])
-                    frame_height = int(dims[1])
-                else:
-                    frame_width = width
-                    frame_height = height
-
-                frame = SampledFrame(
-                    timestamp=timestamp,
-                    index=idx,
-                    width=frame_width,
-                    height=frame_height,
-                    jpeg_bytes=jpeg_bytes,
-                    file_path=output_path if keep_files else None,
-                )
-                frames.append(frame)
-
-                # Clean up if not keeping files
-                if not keep_files:
-                    os.unlink(output_path)
+        # Create output directory
+        if keep_files:
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+                temp_dir = output_dir
+            else:
+                temp_dir = tempfile.mkdtemp(prefix="frames_")
+
+        hw_input_args, hw_download = _hwaccel_args(hwaccel)
+        output_filter = ",".join(f for f in (hw_download, scale_filter) if f) or None
+
+        extracted = None
+        if av is not None and not hw_input_args:
+            extracted = _extract_frames_pyav(
+                video_path,
+                sample_times,
+                quality,
+                _scaled_dims(width, height, max_dimension),
+                temp_dir,
+            )
+
+        if extracted is None:
+            # FFmpeg CLI; a batched extraction that isn't keeping its files
+            # streams frames over a pipe and needs no directory
+            batch = _should_batch(sample_times)
+            if temp_dir is None and not batch:
+                temp_dir = tempfile.mkdtemp(prefix="frames_")
+                cleanup_temp = True
+
+            extract = _extract_frames_batched if batch else _extract_frames_seeking
+            extracted = extract(
+                video_path, sample_times, temp_dir, quality, output_filter, hw_input_args,
+            )
+            if hw_input_args and not extracted:
+                # The build lists the decoder but the device isn't usable
+                # (no GPU, unsupported codec); retry in software
+                extracted = extract(video_path, sample_times, temp_dir, quality, scale_filter)
+
+        for idx, timestamp, jpeg_bytes, output_path in extracted:
+            # Get actual frame dimensions (may be scaled)
+            frame_width, frame_height = _jpeg_dims(jpeg_bytes) or (width, height)
+
+            frame = SampledFrame(
+                timestamp=timestamp,
+                index=idx,
+                width=frame_width,
+                height=frame_height,
+                jpeg_bytes=jpeg_bytes,
+                file_path=output_path if keep_files else None,
+            )
+            frames.append(frame)
 
     finally:
-        # Clean up temp directory if not keeping files
-        if cleanup_temp and os.path.exists(temp_dir):
-            try:
-                os.rmdir(temp_dir)
-            except:
-                pass
+        # Clean up temp directory and its frames if not keeping files
+        if cleanup_temp:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
     return SamplingResult(
         video_path=video_path,
@@ -12,6 +12,14 @@ import subprocess
 import re
 from typing import List, Dict, Optional
 
+import numpy as np
+
+
+# silence_start / silence_end events, matched on raw stderr bytes
+_SILENCE_RE = re.compile(
+    rb'silence_(start|end):\s*([\d.]+)(?:\s*\|\s*silence_duration:\s*([\d.]+))?'
+)
+
 
 def detect_silences(
     audio_path: str,
@@ -31,22 +39,14 @@ def detect_silences(
     """
     cmd = [
         "ffmpeg",
+        "-nostats",
         "-i", audio_path,
         "-af", f"silencedetect=noise={noise_threshold}:d={min_duration}",
         "-f", "null",
         "-"
     ]
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-    )
-
-    # FFmpeg outputs silence info to stderr
-    output = result.stderr
-
-    # Parse silence_start and silence_end from output
+    # Parse silence_start and silence_end from FFmpeg's stderr
     # Example output lines:
     # [silencedetect @ 0x...] silence_start: 1.234
     # [silencedetect @ 0x...] silence_end: 2.567 | silence_duration: 1.333
@@ -54,28 +54,25 @@ def detect_silences(
     silences = []
     current_start = None
 
-    # Pattern for silence_start
-    start_pattern = re.compile(r'silence_start:\s*([\d.]+)')
-    # Pattern for silence_end with duration
-    end_pattern = re.compile(r'silence_end:\s*([\d.]+)\s*\|\s*silence_duration:\s*([\d.]+)')
-
-    for line in output.split('\n'):
-        start_match = start_pattern.search(line)
-        if start_match:
-            current_start = float(start_match.group(1))
-            continue
-
-        end_match = end_pattern.search(line)
-        if end_match and current_start is not None:
-            end_time = float(end_match.group(1))
-            duration = float(end_match.group(2))
-
-            silences.append({
-                "start": current_start,
-                "end": end_time,
-                "duration": duration,
-            })
-            current_start = None
+    # Stream stderr and parse while FFmpeg is still running, rather than
+    # buffering the whole log
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    ) as proc:
+        for line in proc.stderr:
+            for match in _SILENCE_RE.finditer(line):
+                kind, value, duration = match.groups()
+                if kind == b"start":
+                    current_start = float(value)
+                elif duration is not None and current_start is not None:
+                    silences.append({
+                        "start": current_start,
+                        "end": float(value),
+                        "duration": float(duration),
+                    })
+                    current_start = None
 
     return silences
 
@@ -103,21 +100,26 @@ def find_speech_segments(
             "duration": total_duration,
         }]
 
-    segments = []
-    current_pos = 0.0
-
-    for silence in sorted(silences, key=lambda x: x["start"]):
-        if silence["start"] > current_pos:
-            duration = silence["start"] - current_pos
-            if duration >= min_speech_duration:
-                segments.append({
-                    "start": current_pos,
-                    "end": silence["start"],
-                    "duration": duration,
-                })
-        current_pos = silence["end"]
+    # Gaps between consecutive silences, in start order
+    starts = np.fromiter((s["start"] for s in silences), dtype=np.float64, count=len(silences))
+    ends = np.fromiter((s["end"] for s in silences), dtype=np.float64, count=len(silences))
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = ends[order]
+
+    gap_starts = np.concatenate(([0.0], ends[:-1]))
+    durations = starts - gap_starts
+    mask = (starts > gap_starts) & (durations >= min_speech_duration)
+
+    segments = [
+        {"start": start, "end": end, "duration": duration}
+        for start, end, duration in zip(
+            gap_starts[mask].tolist(), starts[mask].tolist(), durations[mask].tolist()
+        )
+    ]
 
     # Add final segment after last silence
+    current_pos = float(ends[-1])
     if current_pos < total_duration:
         duration = total_duration - current_pos
         if duration >= min_speech_duration:
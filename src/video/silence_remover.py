@@ -9,10 +9,12 @@ Usage:
 """
 
 import os
+import shutil
 import subprocess
-import tempfile
 from typing import List, Dict, Optional
 
+from src.video.edit_sync import filter_complex_args
+
 
 def remove_silences(
     audio_path: str,
@@ -46,10 +48,7 @@ def remove_silences(
 
     if not removable:
         # No silences to remove, just copy the file
-        subprocess.run(
-            ["cp", audio_path, output_path],
-            check=True,
-        )
+        shutil.copyfile(audio_path, output_path)
         return output_path
 
     # Build filter complex for removing silences
@@ -90,62 +89,36 @@ def remove_silences(
     if not segments_to_keep:
         raise ValueError("No audio segments to keep after silence removal")
 
-    # Use FFmpeg concat demuxer approach
-    # First, extract each segment to temp files, then concat
-    temp_dir = tempfile.mkdtemp(prefix="silence_removal_")
-    temp_files = []
-
+    segments_to_keep = [seg for seg in segments_to_keep if seg['end'] > seg['start']]
+    if not segments_to_keep:
+        raise ValueError("No valid segments after extraction")
+
+    # Cut and join the speaking segments in a single FFmpeg pass; atrim cuts
+    # at exact sample positions, unlike stream-copy extraction
+    n = len(segments_to_keep)
+    trims = ";".join(
+        f"[0:a]atrim=start={seg['start']}:end={seg['end']},asetpts=PTS-STARTPTS[a{i}]"
+        for i, seg in enumerate(segments_to_keep)
+    )
+    inputs = "".join(f"[a{i}]" for i in range(n))
+    filter_complex = f"{trims};{inputs}concat=n={n}:v=0:a=1[out]"
+
+    filter_args, script_path = filter_complex_args(filter_complex, n)
     try:
-        for i, seg in enumerate(segments_to_keep):
-            temp_file = os.path.join(temp_dir, f"segment_{i:04d}.wav")
-            temp_files.append(temp_file)
-
-            duration = seg['end'] - seg['start']
-            if duration <= 0:
-                continue
-
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", audio_path,
-                "-ss", str(seg['start']),
-                "-t", str(duration),
-                "-c", "copy",
-                temp_file
-            ]
-            subprocess.run(cmd, capture_output=True, check=True)
-
-        # Filter out empty files
-        temp_files = [f for f in temp_files if os.path.exists(f) and os.path.getsize(f) > 0]
-
-        if not temp_files:
-            raise ValueError("No valid segments after extraction")
-
-        # Create concat list file
-        concat_list = os.path.join(temp_dir, "concat.txt")
-        with open(concat_list, "w") as f:
-            for temp_file in temp_files:
-                f.write(f"file '{temp_file}'\n")
-
-        # Concat all segments
-        concat_cmd = [
+        cmd = [
             "ffmpeg", "-y",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", concat_list,
-            "-c", "copy",
+            "-i", audio_path,
+            *filter_args,
+            "-map", "[out]",
             output_path
         ]
-        subprocess.run(concat_cmd, capture_output=True, check=True)
-
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
     finally:
-        # Cleanup temp files
-        for f in temp_files:
-            if os.path.exists(f):
-                os.remove(f)
-        if os.path.exists(concat_list):
-            os.remove(concat_list)
-        if os.path.exists(temp_dir):
-            os.rmdir(temp_dir)
+        if script_path:
+            try:
+                os.remove(script_path)
+            except FileNotFoundError:
+                pass
 
     return output_path
 
@@ -198,7 +171,7 @@ def extract_clip_with_silence_removed(
         "-c", "copy",
         temp_clip
     ]
-    subprocess.run(extract_cmd, capture_output=True, check=True)
+    subprocess.run(extract_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
 
     try:
         # Remove silences from the clip
@@ -215,8 +188,11 @@ def extract_clip_with_silence_removed(
             os.rename(temp_clip, output_path)
             temp_clip = None
     finally:
-        if temp_clip and os.path.exists(temp_clip):
-            os.remove(temp_clip)
+        if temp_clip:
+            try:
+                os.remove(temp_clip)
+            except FileNotFoundError:
+                pass
 
     return output_path
 
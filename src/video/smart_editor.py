@@ -17,10 +17,15 @@ Usage:
     # cuts = list of segments to KEEP
 """
 
+import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import sys
+from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 
 class EditPreset(Enum):
@@ -102,7 +107,7 @@ PRESETS: Dict[EditPreset, EditConfig] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class EditSegment:
     """A segment to keep or cut."""
     start: float
@@ -112,17 +117,188 @@ class EditSegment:
     text: Optional[str] = None
 
 
-@dataclass
-class WordInfo:
-    """Word with timing and metadata."""
-    word: str
-    start: float
-    end: float
-    clean_word: str = ""  # Lowercase, no punctuation
-    is_filler: bool = False
+# Characters stripped from clean_word: anything that isn't a word character
+# or whitespace. ASCII words use a translate() table built from the same
+# pattern; other words go through the regex so Unicode punctuation (’, …)
+# is stripped too.
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_PUNCT_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _PUNCT_RE.match(c)
+))
+
+
+# Separator for joining words into one string, for bulk cleaning and
+# filler matching. clean_word never contains it, since punctuation is stripped.
+_WORD_SEP = '\x00'
+
+# Punctuation stripping for _WORD_SEP-joined words, keeping the separator
+_JOINED_PUNCT_RE = re.compile(r'[^\w\s\x00]')
+_JOINED_PUNCT_TABLE = {k: v for k, v in _PUNCT_TABLE.items() if chr(k) != _WORD_SEP}
+
+
+@lru_cache(maxsize=None)
+def _compiled_fillers(filler_words: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile filler phrases into one regex over _WORD_SEP-joined clean words.
+
+    Multi-word fillers are split on spaces and must match consecutive
+    words; fillers without a space are matched as a whole clean_word,
+    exactly as written. Phrases are merged into a word trie so shared
+    leading words are matched once (e.g. "i mean" and "i mean it" become
+    i<sep>mean(?:<sep>it)?). Each match is a zero-width lookahead at a
+    word start capturing the filler, so overlapping fillers are all found,
+    and the greedy trie yields the longest filler at each start.
+    Cached, so editors sharing a preset's filler list compile it once.
+    Returns None if there are no fillers.
+    """
+    trie: Dict[Optional[str], dict] = {}
+    for filler in filler_words:
+        parts = filler.split() if ' ' in filler else [filler]
+        if parts:
+            node = trie
+            for part in parts:
+                node = node.setdefault(part, {})
+            node[None] = {}  # A filler ends here
+    if not trie:
+        return None
+
+    return re.compile(
+        f'(?<![^{_WORD_SEP}])(?=((?:{_trie_pattern(trie)}))(?![^{_WORD_SEP}]))'
+    )
+
+
+def _trie_pattern(node: Dict[Optional[str], dict]) -> str:
+    """Regex alternation for the words branching from a filler trie node."""
+    alternatives = []
+    for word in sorted(k for k in node if k is not None):
+        child = node[word]
+        pattern = re.escape(word)
+        if any(k is not None for k in child):
+            rest = f'{_WORD_SEP}(?:{_trie_pattern(child)})'
+            # Longer fillers are tried first; stop here if one also ends here
+            pattern += f'(?:{rest})?' if None in child else rest
+        alternatives.append(pattern)
+    return '|'.join(alternatives)
+
+
+def _clean_words(words: List[str]) -> List[str]:
+    """
+    Lowercase words and strip their punctuation.
 
-    def __post_init__(self):
-        self.clean_word = re.sub(r'[^\w\s]', '', self.word.lower())
+    All words are joined and cleaned as one string, then split again.
+    Results are interned so repeated words share one object and compare
+    by identity.
+    """
+    joined = _WORD_SEP.join(words).lower()
+    if joined.isascii():
+        joined = joined.translate(_JOINED_PUNCT_TABLE)
+    else:
+        joined = _JOINED_PUNCT_RE.sub('', joined)
+    cleaned = joined.split(_WORD_SEP)
+
+    if len(cleaned) != len(words):
+        # Empty input, or a word containing the separator: clean one by one
+        cleaned = []
+        for lowered in map(str.lower, words):
+            if lowered.isascii():
+                cleaned.append(lowered.translate(_PUNCT_TABLE))
+            else:
+                cleaned.append(_PUNCT_RE.sub('', lowered))
+
+    return list(map(sys.intern, cleaned))
+
+
+def _is_sorted(values: np.ndarray) -> bool:
+    """Check that values never decrease."""
+    return bool(np.all(values[:-1] <= values[1:]))
+
+
+def _word_columns(segments: List[Dict]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Flatten the words of all segments into text, start and end columns."""
+    raw = [w for seg in segments for w in seg.get('words', [])]
+    starts = [w.get('start', 0) for w in raw]
+    ends = [w.get('end', start) for w, start in zip(raw, starts)]
+    return (
+        [w.get('word', '') for w in raw],
+        np.array(starts, dtype=np.float64),
+        np.array(ends, dtype=np.float64),
+    )
+
+
+def _clip_indices(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    clip_start: Optional[float],
+    clip_end: Optional[float],
+) -> Union[slice, np.ndarray]:
+    """
+    Select the words inside a clip range.
+
+    A word is dropped if it ends before clip_start or starts after
+    clip_end; with ordered timestamps the kept words form one contiguous
+    run found by bisection.
+    """
+    if clip_start is None and clip_end is None:
+        return slice(None)
+    if _is_sorted(starts) and _is_sorted(ends):
+        lo = 0 if clip_start is None else int(np.searchsorted(ends, clip_start, side="left"))
+        hi = len(starts) if clip_end is None else int(np.searchsorted(starts, clip_end, side="right"))
+        return slice(lo, max(lo, hi))
+    keep = np.ones(len(starts), dtype=bool)
+    if clip_start is not None:
+        keep &= ~(ends < clip_start)
+    if clip_end is not None:
+        keep &= ~(starts > clip_end)
+    return np.flatnonzero(keep)
+
+
+def _take(items: List[str], keep: Union[slice, np.ndarray]) -> List[str]:
+    """Index a list with a slice or an index array."""
+    if isinstance(keep, slice):
+        return items[keep]
+    return [items[i] for i in keep.tolist()]
+
+
+@dataclass(slots=True)
+class Words:
+    """Words with timing and metadata, stored as parallel columns."""
+    text: List[str]
+    clean: List[str]  # Lowercase, no punctuation
+    starts: np.ndarray  # float64 start time of each word
+    ends: np.ndarray  # float64 end time of each word
+    is_filler: np.ndarray  # bool, set by SmartEditor._mark_fillers
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def select(self, keep: Union[slice, np.ndarray]) -> "Words":
+        """Get a subset of the words, with a fresh filler mask."""
+        text = _take(self.text, keep)
+        return Words(
+            text=text,
+            clean=_take(self.clean, keep),
+            starts=self.starts[keep],
+            ends=self.ends[keep],
+            is_filler=np.zeros(len(text), dtype=bool),
+        )
+
+
+# Edit kinds counted by calculate_time_savings
+_TAG_KEEP, _TAG_PAUSE, _TAG_FILLER, _TAG_RESTART, _TAG_OTHER = range(5)
+_NUM_TAGS = 5
+
+
+def _reason_tag(edit: EditSegment) -> int:
+    """Classify an edit for time-savings totals."""
+    if edit.keep:
+        return _TAG_KEEP
+    if "pause" in edit.reason:
+        return _TAG_PAUSE
+    if edit.reason == "filler":
+        return _TAG_FILLER
+    if edit.reason == "restart":
+        return _TAG_RESTART
+    return _TAG_OTHER
 
 
 class SmartEditor:
@@ -139,6 +315,7 @@ class SmartEditor:
             self.config = PRESETS.get(preset, PRESETS[EditPreset.LINKEDIN])
 
         self.preset = preset
+        self._filler_pattern = _compiled_fillers(tuple(self.config.filler_words))
 
     def analyze(
         self,
@@ -158,22 +335,24 @@ class SmartEditor:
             List of EditSegments indicating what to keep/cut
         """
         # Extract all words with timing
-        all_words = self._extract_words(segments, clip_start, clip_end)
+        return self._analyze_words(self._extract_words(segments, clip_start, clip_end))
 
-        if not all_words:
+    def _analyze_words(self, words: Words) -> List[EditSegment]:
+        """Run filler, restart and pause analysis over extracted words."""
+        if not len(words):
             return []
 
         # Mark filler words
         if self.config.remove_fillers:
-            self._mark_fillers(all_words)
+            self._mark_fillers(words)
 
         # Detect restarts/stumbles
         restarts = []
         if self.config.detect_restarts:
-            restarts = self._detect_restarts(all_words)
+            restarts = self._detect_restarts(words.clean, words.starts, words.ends)
 
         # Generate edit segments
-        edits = self._generate_edits(all_words, restarts)
+        edits = self._generate_edits(words, restarts)
 
         return edits
 
@@ -182,118 +361,212 @@ class SmartEditor:
         segments: List[Dict],
         clip_start: Optional[float],
         clip_end: Optional[float],
-    ) -> List[WordInfo]:
+    ) -> Words:
         """Extract all words from segments."""
-        words = []
-
-        for seg in segments:
-            seg_words = seg.get('words', [])
-
-            for w in seg_words:
-                word_start = w.get('start', 0)
-                word_end = w.get('end', word_start)
-
-                # Filter to clip range if specified
-                if clip_start is not None and word_end < clip_start:
-                    continue
-                if clip_end is not None and word_start > clip_end:
-                    continue
-
-                words.append(WordInfo(
-                    word=w.get('word', ''),
-                    start=word_start,
-                    end=word_end,
-                ))
-
-        return words
-
-    def _mark_fillers(self, words: List[WordInfo]) -> None:
-        """Mark filler words in the word list."""
-        single_fillers = set()
-        multi_fillers = []
-
-        for filler in self.config.filler_words:
-            if ' ' in filler:
-                multi_fillers.append(filler.split())
-            else:
-                single_fillers.add(filler)
-
-        # Mark single-word fillers
-        for word in words:
-            if word.clean_word in single_fillers:
-                word.is_filler = True
-
-        # Mark multi-word fillers (e.g., "you know")
-        for i, word in enumerate(words):
-            for filler_parts in multi_fillers:
-                if i + len(filler_parts) > len(words):
-                    continue
-
-                match = True
-                for j, part in enumerate(filler_parts):
-                    if words[i + j].clean_word != part:
-                        match = False
-                        break
-
-                if match:
-                    for j in range(len(filler_parts)):
-                        words[i + j].is_filler = True
-
-    def _detect_restarts(self, words: List[WordInfo]) -> List[Tuple[int, int]]:
+        texts, starts, ends = _word_columns(segments)
+
+        # Filter to clip range if specified; only the kept words are cleaned
+        keep = _clip_indices(starts, ends, clip_start, clip_end)
+        texts = _take(texts, keep)
+        return Words(
+            text=texts,
+            clean=_clean_words(texts),
+            starts=starts[keep],
+            ends=ends[keep],
+            is_filler=np.zeros(len(texts), dtype=bool),
+        )
+
+    @staticmethod
+    def _word_table(segments: List[Dict]) -> Words:
+        """Extract and clean every word once, for slicing into many clips."""
+        texts, starts, ends = _word_columns(segments)
+        return Words(
+            text=texts,
+            clean=_clean_words(texts),
+            starts=starts,
+            ends=ends,
+            is_filler=np.zeros(len(texts), dtype=bool),
+        )
+
+    def _mark_fillers(self, words: Words) -> None:
+        """Mark filler words in words.is_filler."""
+        clean = words.clean
+        is_filler = words.is_filler
+        if self._filler_pattern is None or not clean:
+            return
+
+        # Scan all words in one regex pass (e.g., "you know" spans two
+        # words) and map each match's offset back to its first word
+        word_at = {}
+        offset = 0
+        for i, token in enumerate(clean):
+            word_at[offset] = i
+            offset += len(token) + 1
+
+        for match in self._filler_pattern.finditer(_WORD_SEP.join(clean)):
+            i = word_at[match.start()]
+            n = match.group(1).count(_WORD_SEP) + 1
+            is_filler[i:i + n] = True
+
+    def _detect_restarts(
+        self,
+        clean: List[str],
+        starts: np.ndarray,
+        ends: np.ndarray,
+    ) -> List[Tuple[int, int]]:
         """
         Detect restarts/stumbles where speaker re-says something.
 
+        Args:
+            clean: clean_word of each word
+            starts: Start time of each word
+            ends: End time of each word
+
         Returns list of (start_idx, end_idx) of words to CUT (the fumbled part).
         """
         restarts = []
 
+        # For every word and sequence length, where that word sequence is
+        # next repeated, so no words need comparing below
+        repeat_by_len = self._next_repeat(clean, 6)
+
         # First, detect sentence-level repeats (e.g., "It's so simple. It's so simple.")
-        sentence_restarts = self._detect_sentence_repeats(words)
+        sentence_restarts = self._detect_sentence_repeats(clean, repeat_by_len, starts, ends)
         restarts.extend(sentence_restarts)
 
-        # Create set of already-cut indices to avoid double-cutting
-        cut_indices = set()
+        # Mark already-cut indices to avoid double-cutting
+        cut_mask = np.zeros(len(clean), dtype=bool)
         for cut_start, cut_end in restarts:
-            for i in range(cut_start, cut_end + 1):
-                cut_indices.add(i)
+            cut_mask[cut_start:cut_end + 1] = True
+        is_cut = cut_mask.tolist()
 
         # Then look for word-level patterns like:
         # "The construction... the construction industry" -> cut first "the construction"
         # "We need to... we need to focus" -> cut first "we need to"
 
-        i = 0
-        while i < len(words) - self.config.min_restart_words:
-            # Skip if this word is already being cut
-            if i in cut_indices:
-                i += 1
+        n = len(clean)
+        window_end = self._restart_window_ends(starts)
+
+        # Restart found at each word: the shortest sequence (2-5 words, at
+        # least min_restart_words) that repeats inside the word's window.
+        # Cutting it keeps the second occurrence (usually cleaner).
+        restart_at = np.full(n, -1, dtype=np.int64)
+        for seq_len in range(self.config.min_restart_words, 6):
+            repeat = repeat_by_len.get(seq_len)
+            if repeat is None:
+                break
+            count = len(repeat)
+            word = np.arange(count)
+            window = window_end[:count]
+            found = (
+                (restart_at[:count] < 0)
+                & (seq_len < window - word)
+                & (repeat <= window - seq_len + 1)
+            )
+            restart_at[:count][found] = repeat[found]
+
+        next_i = 0
+        for i in np.flatnonzero(restart_at >= 0).tolist():
+            # Skip words inside the last cut, or already being cut
+            if i < next_i or i >= n - self.config.min_restart_words or is_cut[i]:
                 continue
 
-            # Get a window of upcoming words
-            window_end = i
-            for j in range(i, len(words)):
-                if words[j].start - words[i].start > self.config.restart_window:
-                    break
-                window_end = j
-
-            # Look for repeated sequences starting at position i
-            restart_found = self._find_restart_in_window(words, i, window_end)
-
-            if restart_found:
-                cut_start, cut_end = restart_found
-                # Check we're not overlapping with sentence restarts
-                overlap = any(idx in cut_indices for idx in range(cut_start, cut_end + 1))
-                if not overlap:
-                    restarts.append((cut_start, cut_end))
-                    # Skip past the cut section
-                    i = cut_end + 1
-                else:
-                    i += 1
-            else:
-                i += 1
+            cut_start, cut_end = i, int(restart_at[i]) - 1
+            # Check we're not overlapping with sentence restarts
+            if not cut_mask[cut_start:cut_end + 1].any():
+                restarts.append((cut_start, cut_end))
+                # Skip past the cut section
+                next_i = cut_end + 1
 
         return restarts
 
-    def _detect_sentence_repeats(self, words: List[WordInfo]) -> List[Tuple[int, int]]:
+    def _restart_window_ends(self, starts: np.ndarray) -> np.ndarray:
+        """
+        For each word, the last word of its restart window.
+
+        The window runs forward from the word until the first word starting
+        more than restart_window seconds after it.
+        """
+        n = len(starts)
+        window = self.config.restart_window
+        word = np.arange(n)
+
+        if not np.all(starts[1:] >= starts[:-1]):
+            start_list = starts.tolist()
+            window_end = word.copy()
+            for i in range(n):
+                for j in range(i, n):
+                    if start_list[j] - start_list[i] > window:
+                        break
+                    window_end[i] = j
+            return window_end
+
+        # With ordered starts the window is every later word within
+        # restart_window; settle float rounding so the bound matches the
+        # gap test exactly
+        window_end = np.searchsorted(starts, starts + window, side="right") - 1
+        while True:
+            grow = (window_end + 1 < n) & (starts[np.minimum(window_end + 1, n - 1)] - starts <= window)
+            if not grow.any():
+                break
+            window_end[grow] += 1
+        while True:
+            shrink = (window_end > word) & (starts[window_end] - starts > window)
+            if not shrink.any():
+                break
+            window_end[shrink] -= 1
+        return np.maximum(window_end, word)
+
+    @staticmethod
+    def _next_repeat(clean: List[str], max_len: int) -> Dict[int, np.ndarray]:
+        """
+        For each sequence length, where each word sequence is next repeated.
+
+        Words are mapped to int32 ids, and every n-word sequence gets an id
+        by packing the (n-1)-word sequence id with the id of the word after
+        it, then re-ranking. Equal sequences share an id, so no words are
+        compared after this.
+
+        Returns {n: array} where array[i] is the start of the first
+        occurrence of clean[i:i + n] at or after i + n (so not overlapping
+        it), or len(clean) if there is none.
+        """
+        n = len(clean)
+        id_map: Dict[str, int] = {}
+        ids = np.fromiter((id_map.setdefault(t, len(id_map)) for t in clean), dtype=np.int32, count=n)
+
+        repeat_by_len = {}
+        seq_ids = ids
+        for length in range(1, min(max_len, n) + 1):
+            if length > 1:
+                packed = seq_ids[:-1].astype(np.int64) * len(id_map) + ids[length - 1:]
+                seq_ids = np.unique(packed, return_inverse=True)[1].astype(np.int32)
+
+            # A stable sort groups equal ids while keeping positions ascending,
+            # so each entry's successor within its group is its next occurrence
+            order = np.argsort(seq_ids, kind="stable")
+            same = seq_ids[order[1:]] == seq_ids[order[:-1]]
+            next_same = np.full(len(seq_ids), n, dtype=np.int64)
+            next_same[order[:-1][same]] = order[1:][same]
+
+            # Follow the chain past occurrences overlapping the sequence
+            repeat = next_same.copy()
+            seq_end = np.arange(len(seq_ids)) + length
+            overlapping = repeat < seq_end
+            while overlapping.any():
+                repeat[overlapping] = next_same[repeat[overlapping]]
+                overlapping = repeat < seq_end
+            repeat_by_len[length] = repeat
+
+        return repeat_by_len
+
+    def _detect_sentence_repeats(
+        self,
+        clean: List[str],
+        repeat_by_len: Dict[int, np.ndarray],
+        starts: np.ndarray,
+        ends: np.ndarray,
+    ) -> List[Tuple[int, int]]:
         """
         Detect when a phrase is repeated regardless of sentence boundaries.
 
@@ -305,228 +578,234 @@ class SmartEditor:
         - "survey quality is... if it's a GIS aerial... If it's a GIS aerial survey"
           -> cut "if it's a GIS aerial" (first occurrence only)
 
+        Args:
+            clean: clean_word of each word
+            repeat_by_len: Result of _next_repeat(clean, 6)
+            starts: Start time of each word
+            ends: End time of each word
+
         Returns list of (start_idx, end_idx) of words to CUT.
         """
         restarts = []
-        already_cut = set()  # Avoid overlapping cuts
+        n = len(clean)
+        already_cut = bytearray(n)  # Avoid overlapping cuts
+
+        starts_sorted = bool(np.all(starts[1:] >= starts[:-1]))
+        start_list = starts.tolist()
+        end_list = ends.tolist()
+
+        # Skip phrases that start with very common words unless longer
+        skip_starts = ['i', 'you', 'and', 'the', 'a', 'um', 'uh', 'so', 'but', 'or']
 
         # Look for repeated phrases of length 3-6 words (not too long)
         for phrase_len in range(3, 7):
-            i = 0
-            while i < len(words) - phrase_len:
-                if i in already_cut:
-                    i += 1
-                    continue
+            count = n - phrase_len
+            if count <= 0:
+                continue
 
-                # Get phrase starting at i
-                phrase = [words[i + k].clean_word for k in range(phrase_len)]
+            # First later repeat of each phrase
+            repeat = repeat_by_len[phrase_len][:count]
+            found = repeat < n
 
-                # Skip phrases that start with very common words unless longer
-                skip_starts = ['i', 'you', 'and', 'the', 'a', 'um', 'uh', 'so', 'but', 'or']
-                if phrase[0] in skip_starts and phrase_len < 4:
-                    i += 1
-                    continue
+            # Look for this phrase later (within 10 second window - tighter).
+            # The scan stops at the first word starting more than 10s after
+            # the phrase ends; with ordered starts, that is past the repeat
+            # exactly when the repeat itself starts within 10s.
+            phrase_end_time = ends[phrase_len - 1:phrase_len - 1 + count]
+            if starts_sorted:
+                found &= starts[np.minimum(repeat, n - 1)] - phrase_end_time <= 10.0
 
-                # Look for this phrase later (within 10 second window - tighter)
-                for j in range(i + phrase_len, len(words) - phrase_len + 1):
-                    # Time window check - only look within 10 seconds
-                    time_gap = words[j].start - words[i + phrase_len - 1].end
-                    if time_gap > 10.0:
-                        break
+            for i in np.flatnonzero(found).tolist():
+                if already_cut[i]:
+                    continue
 
-                    # Check if phrase matches
-                    match = True
-                    for k in range(phrase_len):
-                        if words[j + k].clean_word != phrase[k]:
-                            match = False
-                            break
-
-                    if match:
-                        # Found a repeat!
-                        # CONSERVATIVE: Only cut the first occurrence of the phrase itself
-                        # Don't cut anything else, even if there's content between them
-                        phrase_end = i + phrase_len - 1
-
-                        # Mark just this phrase as cut
-                        for k in range(i, phrase_end + 1):
-                            already_cut.add(k)
-                        restarts.append((i, phrase_end))
-                        break
+                if clean[i] in skip_starts and phrase_len < 4:
+                    continue
 
-                i += 1
+                phrase_end = i + phrase_len - 1
+                if not starts_sorted:
+                    j = int(repeat[i])
+                    if any(
+                        start_list[k] - end_list[phrase_end] > 10.0
+                        for k in range(phrase_end + 1, j + 1)
+                    ):
+                        continue
+
+                # Found a repeat!
+                # CONSERVATIVE: Only cut the first occurrence of the phrase itself
+                # Don't cut anything else, even if there's content between them
+                already_cut[i:phrase_end + 1] = b"\x01" * phrase_len
+                restarts.append((i, phrase_end))
 
         return restarts
 
-    def _find_restart_in_window(
-        self,
-        words: List[WordInfo],
-        start: int,
-        end: int,
-    ) -> Optional[Tuple[int, int]]:
-        """
-        Look for a restart pattern in a window of words.
-
-        Returns (cut_start, cut_end) indices if restart found, None otherwise.
-        """
-        # Try different sequence lengths
-        for seq_len in range(self.config.min_restart_words, min(6, end - start)):
-            # Get the sequence at position start
-            seq = [words[start + k].clean_word for k in range(seq_len)]
-
-            # Look for this sequence later in the window
-            for j in range(start + seq_len, end - seq_len + 2):
-                match = True
-                for k in range(seq_len):
-                    if j + k >= len(words):
-                        match = False
-                        break
-                    if words[j + k].clean_word != seq[k]:
-                        match = False
-                        break
-
-                if match:
-                    # Found a restart! Cut from start to just before the restart
-                    # Keep the second occurrence (usually cleaner)
-                    return (start, j - 1)
-
-        return None
-
     def _generate_edits(
         self,
-        words: List[WordInfo],
+        words: Words,
         restarts: List[Tuple[int, int]],
     ) -> List[EditSegment]:
-        """Generate final edit segments."""
-        if not words:
+        """
+        Generate final edit segments.
+
+        Args:
+            words: Words to edit, with fillers already marked
+            restarts: (start_idx, end_idx) word ranges to cut as restarts
+        """
+        if not len(words):
             return []
 
         edits = []
 
-        # Create a set of word indices to cut
-        cut_indices = set()
+        # Mark word indices to cut
+        cut_mask = np.zeros(len(words), dtype=bool)
 
         # Add restart cuts
         for cut_start, cut_end in restarts:
-            for i in range(cut_start, cut_end + 1):
-                cut_indices.add(i)
+            cut_mask[cut_start:cut_end + 1] = True
 
         # Add filler word cuts
         if self.config.remove_fillers:
-            for i, word in enumerate(words):
-                if word.is_filler:
-                    cut_indices.add(i)
-
-        # Now generate segments
-        current_segment_start = None
-        current_segment_text = []
+            cut_mask |= words.is_filler
+        is_cut = cut_mask.tolist()
+        is_filler = words.is_filler.tolist()
+        texts = words.text
+        starts, ends = words.starts, words.ends
+        start_times, end_times = starts.tolist(), ends.tolist()
+
+        # Whether each word ends with sentence-ending punctuation, decided
+        # once per word (str.endswith takes the whole tuple in one call)
+        end_chars = tuple(self.config.sentence_end_chars)
+        ends_sentence = [text.rstrip().endswith(end_chars) for text in texts]
+
+        # Classify every inter-word gap in one pass. The allowed pause after
+        # a word depends on whether it ended a sentence.
+        sentence_end_mask = np.array(ends_sentence[:-1], dtype=bool)
+        gaps = starts[1:] - ends[:-1]
+        max_pause = np.where(
+            sentence_end_mask, self.config.sentence_end_pause, self.config.max_pause_duration
+        )
+        # long_pause_before[i] is True when the gap before word i is too long
+        long_pause_before = np.concatenate(([False], gaps > max_pause))
+        trim_pause_before = [False] + (gaps > self.config.min_pause_to_trim).tolist()
+        gap_before = [0.0] + gaps.tolist()
+
+        # Now generate segments. Only words with a long pause before them or
+        # that are cut end a segment; every word in between is kept, so runs
+        # of kept words are emitted whole.
+        segment_from = None  # First word of the open keep segment
+        next_word = 0
+
+        def close_segment(last: int) -> None:
+            edits.append(EditSegment(
+                start=start_times[segment_from],
+                end=end_times[last],
+                keep=True,
+                reason="speech",
+                text=" ".join(texts[segment_from:last + 1]),
+            ))
 
-        def is_sentence_end(word_text: str) -> bool:
-            """Check if word ends with sentence-ending punctuation."""
-            return any(word_text.rstrip().endswith(c) for c in self.config.sentence_end_chars)
+        for i in np.flatnonzero(long_pause_before | cut_mask).tolist():
+            # Words since the last boundary are kept
+            if segment_from is None and next_word < i:
+                segment_from = next_word
+            next_word = i + 1
 
-        for i, word in enumerate(words):
             # Check for pause before this word
-            if i > 0:
-                gap = word.start - words[i - 1].end
-                prev_word = words[i - 1]
-
-                # Determine max allowed pause based on whether previous word ended a sentence
-                if is_sentence_end(prev_word.word):
-                    max_pause = self.config.sentence_end_pause
+            if long_pause_before[i]:
+                gap = gap_before[i]
+                if ends_sentence[i - 1]:
                     replacement_pause = self.config.sentence_end_pause
                 else:
-                    max_pause = self.config.max_pause_duration
                     replacement_pause = self.config.pause_replacement
 
-                if gap > max_pause:
-                    # End current segment, add pause handling
-                    if current_segment_start is not None:
-                        edits.append(EditSegment(
-                            start=current_segment_start,
-                            end=words[i - 1].end,
-                            keep=True,
-                            reason="speech",
-                            text=" ".join(current_segment_text),
-                        ))
-                        current_segment_start = None
-                        current_segment_text = []
-
-                    # Add trimmed pause (but respect sentence boundaries)
-                    if gap > self.config.min_pause_to_trim:
-                        edits.append(EditSegment(
-                            start=words[i - 1].end,
-                            end=word.start,
-                            keep=False,
-                            reason=f"long_pause ({gap:.2f}s -> {replacement_pause:.2f}s)",
-                        ))
+                # End current segment, add pause handling
+                if segment_from is not None:
+                    close_segment(i - 1)
+                    segment_from = None
 
-            # Handle this word
-            if i in cut_indices:
-                # End current segment if any
-                if current_segment_start is not None:
+                # Add trimmed pause (but respect sentence boundaries)
+                if trim_pause_before[i]:
                     edits.append(EditSegment(
-                        start=current_segment_start,
-                        end=words[i - 1].end if i > 0 else word.start,
-                        keep=True,
-                        reason="speech",
-                        text=" ".join(current_segment_text),
+                        start=end_times[i - 1],
+                        end=start_times[i],
+                        keep=False,
+                        reason=f"long_pause ({gap:.2f}s -> {replacement_pause:.2f}s)",
                     ))
-                    current_segment_start = None
-                    current_segment_text = []
+
+            # Handle this word
+            if is_cut[i]:
+                # End current segment if any
+                if segment_from is not None:
+                    close_segment(i - 1)
+                    segment_from = None
 
                 # Add cut segment
-                reason = "filler" if word.is_filler else "restart"
+                reason = "filler" if is_filler[i] else "restart"
                 edits.append(EditSegment(
-                    start=word.start,
-                    end=word.end,
+                    start=start_times[i],
+                    end=end_times[i],
                     keep=False,
                     reason=reason,
-                    text=word.word,
+                    text=texts[i],
                 ))
-            else:
+            elif segment_from is None:
                 # Keep this word
-                if current_segment_start is None:
-                    current_segment_start = word.start
-                current_segment_text.append(word.word)
+                segment_from = i
 
         # Close final segment
-        if current_segment_start is not None:
-            edits.append(EditSegment(
-                start=current_segment_start,
-                end=words[-1].end,
-                keep=True,
-                reason="speech",
-                text=" ".join(current_segment_text),
-            ))
+        if segment_from is None and next_word < len(words):
+            segment_from = next_word
+        if segment_from is not None:
+            close_segment(len(words) - 1)
 
         # Merge adjacent keep segments and calculate time savings
         return self._merge_segments(edits)
 
     def _merge_segments(self, edits: List[EditSegment]) -> List[EditSegment]:
         """Merge adjacent segments of the same type."""
-        if not edits:
-            return []
-
         merged = []
-        current = edits[0]
-
-        for edit in edits[1:]:
-            if edit.keep == current.keep and edit.keep:
-                # Merge keep segments
-                current = EditSegment(
-                    start=current.start,
-                    end=edit.end,
+        i = 0
+
+        while i < len(edits):
+            # Find the run of keep segments starting here
+            j = i + 1
+            if edits[i].keep:
+                while j < len(edits) and edits[j].keep:
+                    j += 1
+
+            if j - i == 1:
+                merged.append(edits[i])
+            else:
+                # Merge keep segments, joining their text once
+                merged.append(EditSegment(
+                    start=edits[i].start,
+                    end=edits[j - 1].end,
                     keep=True,
                     reason="speech",
-                    text=f"{current.text or ''} {edit.text or ''}".strip(),
-                )
-            else:
-                merged.append(current)
-                current = edit
+                    text=self._join_texts([edit.text for edit in edits[i:j]]),
+                ))
+            i = j
 
-        merged.append(current)
         return merged
 
+    @staticmethod
+    def _join_texts(texts: List[Optional[str]]) -> str:
+        """
+        Join the texts of two or more merged segments.
+
+        Gives the same result as pairwise f"{a or ''} {b or ''}".strip() over
+        the list, but builds the string once. Each step strips the running
+        text, so only the first text keeps its trailing whitespace, and
+        blank texts after the first two add nothing.
+        """
+        head = f"{texts[0] or ''} {texts[1] or ''}".strip()
+        parts = [head] if head else []
+        for text in texts[2:]:
+            text = (text or '').rstrip()
+            if text:
+                parts.append(text if parts else text.lstrip())
+        return " ".join(parts)
+
     def get_segments_to_keep(self, edits: List[EditSegment]) -> List[Dict[str, float]]:
         """Get just the segments to keep as simple dicts."""
         return [
@@ -537,26 +816,23 @@ class SmartEditor:
 
     def calculate_time_savings(self, edits: List[EditSegment]) -> Dict[str, float]:
         """Calculate how much time is saved by edits."""
-        original_duration = 0
-        edited_duration = 0
-        pause_savings = 0
-        filler_savings = 0
-        restart_savings = 0
-
-        for edit in edits:
-            duration = edit.end - edit.start
-            original_duration += duration
-
-            if edit.keep:
-                edited_duration += duration
-            else:
-                if "pause" in edit.reason:
-                    pause_savings += duration - self.config.pause_replacement
-                    edited_duration += self.config.pause_replacement
-                elif edit.reason == "filler":
-                    filler_savings += duration
-                elif edit.reason == "restart":
-                    restart_savings += duration
+        # Sum durations per kind of edit in one pass. Long pauses are
+        # shortened to pause_replacement, not removed.
+        pause_replacement = self.config.pause_replacement
+        tags = np.fromiter((_reason_tag(e) for e in edits), dtype=np.intp, count=len(edits))
+        durations = np.fromiter((e.end - e.start for e in edits), dtype=np.float64, count=len(edits))
+        is_pause = tags == _TAG_PAUSE
+        savings = np.bincount(
+            tags, weights=np.where(is_pause, durations - pause_replacement, durations), minlength=_NUM_TAGS
+        )
+        kept = np.where(tags == _TAG_KEEP, durations, np.where(is_pause, pause_replacement, 0.0))
+
+        # Running sums (not pairwise) so totals add up in edit order
+        original_duration = float(np.cumsum(durations)[-1]) if len(edits) else 0.0
+        edited_duration = float(np.cumsum(kept)[-1]) if len(edits) else 0.0
+        pause_savings = float(savings[_TAG_PAUSE])
+        filler_savings = float(savings[_TAG_FILLER])
+        restart_savings = float(savings[_TAG_RESTART])
 
         return {
             "original_duration": original_duration,
@@ -569,6 +845,18 @@ class SmartEditor:
         }
 
 
+@lru_cache(maxsize=8)
+def _get_editor(preset: EditPreset) -> SmartEditor:
+    """
+    Get a shared SmartEditor for a preset.
+
+    analyze() keeps no state between calls, so one editor per preset can
+    serve every clip. Editors built from a custom EditConfig are not
+    cached here; construct those directly.
+    """
+    return SmartEditor(preset=preset)
+
+
 def analyze_clip(
     segments: List[Dict],
     start_time: float,
@@ -587,10 +875,19 @@ def analyze_clip(
     Returns:
         Dict with segments_to_keep, time_savings, and edit_details
     """
+    editor = _preset_editor(preset)
+    edits = editor.analyze(segments, start_time, end_time)
+    return _clip_result(editor, edits)
+
+
+def _preset_editor(preset: str) -> SmartEditor:
+    """Get the shared editor for a preset name, defaulting to LinkedIn."""
     preset_enum = EditPreset(preset) if preset in [p.value for p in EditPreset] else EditPreset.LINKEDIN
-    editor = SmartEditor(preset=preset_enum)
+    return _get_editor(preset_enum)
 
-    edits = editor.analyze(segments, start_time, end_time)
+
+def _clip_result(editor: SmartEditor, edits: List[EditSegment]) -> Dict[str, Any]:
+    """Build the analyze_clip result for a clip's edits."""
     segments_to_keep = editor.get_segments_to_keep(edits)
     time_savings = editor.calculate_time_savings(edits)
 
@@ -610,6 +907,74 @@ def analyze_clip(
     }
 
 
+# Transcript words for analyze_clips workers, set once per worker process
+_worker_words: Optional[Words] = None
+
+
+def _init_clip_worker(words: Words) -> None:
+    """Process pool initializer: keep the transcript words for this worker."""
+    global _worker_words
+    _worker_words = words
+
+
+def _analyze_clip_words(words: Words, start_time: float, end_time: float, preset: str) -> Dict[str, Any]:
+    """analyze_clip over an already extracted word table."""
+    editor = _preset_editor(preset)
+    clip_words = words.select(_clip_indices(words.starts, words.ends, start_time, end_time))
+    return _clip_result(editor, editor._analyze_words(clip_words))
+
+
+def _analyze_clip_in_worker(start_time: float, end_time: float, preset: str) -> Dict[str, Any]:
+    """analyze_clip over this worker's transcript words."""
+    return _analyze_clip_words(_worker_words, start_time, end_time, preset)
+
+
+def analyze_clips(
+    segments: List[Dict],
+    clip_ranges: List[Tuple[float, float]],
+    preset: str = "linkedin",
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Analyze several clips of one transcript in parallel.
+
+    Words are extracted and cleaned once for the whole transcript and each
+    clip analyzes its slice of them. Analysis is pure-Python CPU work, so
+    clips are spread over a process pool; the word table is sent to each
+    worker once, not once per clip.
+
+    Args:
+        segments: Full transcript segments
+        clip_ranges: (start_time, end_time) of each clip
+        preset: Platform preset name
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        analyze_clip results, in the same order as clip_ranges
+    """
+    if len(clip_ranges) <= 1:
+        return [analyze_clip(segments, start, end, preset) for start, end in clip_ranges]
+
+    words = SmartEditor._word_table(segments)
+    if max_workers == 1:
+        return [_analyze_clip_words(words, start, end, preset) for start, end in clip_ranges]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(max_workers or os.cpu_count() or 1, len(clip_ranges))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_clip_worker,
+        initargs=(words,),
+    ) as pool:
+        return list(pool.map(
+            _analyze_clip_in_worker,
+            [start for start, _ in clip_ranges],
+            [end for _, end in clip_ranges],
+            [preset] * len(clip_ranges),
+        ))
+
+
 if __name__ == "__main__":
     # Test with sample data
     print("Smart Editor - Test Mode")
@@ -13,105 +13,163 @@ Usage:
     result = transcribe_audio("audio.wav", backend="local")
 """
 
+import hashlib
+import json
 import os
+import tempfile
 import time
-from typing import Dict, Any, List, Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Optional: faster parsing of Deepgram's JSON response
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 
-def transcribe_audio_deepgram(
-    audio_path: str,
-    language: Optional[str] = None,
-) -> Dict[str, Any]:
+# Deepgram request settings
+_DEEPGRAM_PARAMS = {
+    "model": "nova-2",
+    "filler_words": "true",  # KEY: Preserve um, uh, like, you know
+    "smart_format": "true",
+    "punctuate": "true",
+    "utterances": "true",
+    "words": "true",  # Word-level timestamps
+}
+
+# Deepgram content types by file extension
+_DEEPGRAM_CONTENT_TYPES = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+}
+
+
+@lru_cache(maxsize=None)
+def _http_session():
     """
-    Transcribe audio using Deepgram API with filler word detection.
+    Shared HTTP session for API calls.
+
+    Keeps connections alive between requests (and chunk workers) so each
+    call skips the TCP/TLS handshake, and retries rate limits and server
+    errors with backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None,  # Uploads are POSTs
+        raise_on_status=False,  # Let raise_for_status() report the last response
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+    return session
 
-    Best for capturing um, uh, like, you know, etc.
 
-    Args:
-        audio_path: Path to audio file
-        language: Optional language code (auto-detected if None)
+@lru_cache(maxsize=None)
+def _openai_client(api_key: str):
+    """Shared OpenAI client per API key, reusing its connection pool."""
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
+
+
+def _split_audio_on_silence(
+    audio_path: str,
+    duration: float,
+    target_len: float = 90.0,
+) -> List[Tuple[float, float]]:
+    """
+    Pick chunk boundaries of roughly target_len seconds for long audio.
+
+    Each cut is placed at the middle of the silence closest to the target
+    length, so words are not split between chunks. Falls back to a hard
+    cut when no silence is near.
 
     Returns:
-        Dict with text, segments, language, etc.
+        (start, end) time of each chunk, covering the whole file
     """
-    import requests
+    from src.video.silence_detector import detect_silences, find_natural_breaks
 
-    api_key = os.getenv("DEEPGRAM_API_KEY")
-    if not api_key:
-        raise ValueError("DEEPGRAM_API_KEY not found")
+    breaks = find_natural_breaks(detect_silences(audio_path, min_duration=0.3), min_break_duration=0.3)
 
-    start_time = time.time()
+    chunks = []
+    chunk_start = 0.0
+    while duration - chunk_start > target_len * 1.5:
+        target = chunk_start + target_len
+        nearby = [b for b in breaks if target - target_len / 2 <= b <= target + target_len / 2]
+        cut = min(nearby, key=lambda b: abs(b - target)) if nearby else target
+        chunks.append((chunk_start, cut))
+        chunk_start = cut
+    chunks.append((chunk_start, duration))
+    return chunks
 
-    # Read audio file
-    with open(audio_path, "rb") as f:
-        audio_data = f.read()
 
+def _deepgram_listen(
+    audio_path: str,
+    api_key: str,
+    language: Optional[str],
+) -> Dict[str, Any]:
+    """POST one audio file to Deepgram and return the raw JSON response."""
     # Determine content type
     ext = os.path.splitext(audio_path)[1].lower()
-    content_types = {
-        ".wav": "audio/wav",
-        ".mp3": "audio/mpeg",
-        ".m4a": "audio/mp4",
-        ".flac": "audio/flac",
-        ".ogg": "audio/ogg",
-    }
-    content_type = content_types.get(ext, "audio/wav")
+    content_type = _DEEPGRAM_CONTENT_TYPES.get(ext, "audio/wav")
 
     # Build request
-    params = {
-        "model": "nova-2",
-        "filler_words": "true",  # KEY: Preserve um, uh, like, you know
-        "smart_format": "true",
-        "punctuate": "true",
-        "utterances": "true",
-        "words": "true",  # Word-level timestamps
-    }
+    params = dict(_DEEPGRAM_PARAMS)
     if language:
         params["language"] = language
 
     url = "https://api.deepgram.com/v1/listen?" + "&".join(f"{k}={v}" for k, v in params.items())
 
-    response = requests.post(
-        url,
-        headers={
-            "Authorization": f"Token {api_key}",
-            "Content-Type": content_type,
-        },
-        data=audio_data,
-        timeout=300,
-    )
+    # Stream the file from disk rather than reading it into memory first.
+    # urllib3 rewinds the file if the session retries the request.
+    with open(audio_path, "rb") as f:
+        response = _http_session().post(
+            url,
+            headers={
+                "Authorization": f"Token {api_key}",
+                "Content-Type": content_type,
+                "Content-Length": str(os.path.getsize(audio_path)),
+            },
+            data=f,
+            timeout=300,
+        )
     response.raise_for_status()
-    result = response.json()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
-    processing_time = time.time() - start_time
 
+def _parse_deepgram_result(
+    result: Dict[str, Any],
+    language: Optional[str],
+    offset: float = 0.0,
+) -> Optional[Dict[str, Any]]:
+    """
+    Convert a Deepgram response into text, segments, language and duration.
+
+    offset is added to every segment and word time, for chunks cut from a
+    longer file. Returns None when the response has no transcript.
+    """
     # Parse response
     channels = result.get("results", {}).get("channels", [])
     if not channels:
-        return {
-            "text": "",
-            "segments": [],
-            "language": language or "en",
-            "language_probability": 0,
-            "duration": 0,
-            "processing_time": processing_time,
-            "model": "deepgram-nova-2",
-        }
+        return None
 
     alternatives = channels[0].get("alternatives", [])
     if not alternatives:
-        return {
-            "text": "",
-            "segments": [],
-            "language": language or "en",
-            "language_probability": 0,
-            "duration": 0,
-            "processing_time": processing_time,
-            "model": "deepgram-nova-2",
-        }
+        return None
 
     transcript_data = alternatives[0]
     full_text = transcript_data.get("transcript", "")
@@ -127,28 +185,45 @@ def transcribe_audio_deepgram(
 
     segments = []
     if utterances:
+        word_starts = [w.get("start", 0) for w in words]
+        word_ends = [w.get("end", 0) for w in words]
+        # Words come back in time order, so an utterance's words are found
+        # by bisecting to its start and scanning until words start after
+        # its end. Fall back to checking every word if the order is off.
+        ordered = (
+            all(a <= b for a, b in zip(word_starts, word_starts[1:]))
+            and all(start <= end for start, end in zip(word_starts, word_ends))
+        )
+
         # Use utterances as segments
         for utt in utterances:
             seg_start = utt.get("start", 0)
             seg_end = utt.get("end", 0)
             seg_text = utt.get("transcript", "")
+            limit = seg_end + 0.1
+
+            if ordered:
+                candidates = range(bisect_left(word_starts, seg_start), bisect_right(word_starts, limit))
+            else:
+                candidates = range(len(words))
 
             # Find words that belong to this utterance
             seg_words = []
-            for w in words:
-                w_start = w.get("start", 0)
-                w_end = w.get("end", 0)
-                if w_start >= seg_start and w_end <= seg_end + 0.1:
+            for i in candidates:
+                w_start = word_starts[i]
+                w_end = word_ends[i]
+                if w_start >= seg_start and w_end <= limit:
+                    w = words[i]
                     seg_words.append({
                         "word": w.get("punctuated_word", w.get("word", "")),
-                        "start": w_start,
-                        "end": w_end,
+                        "start": w_start + offset,
+                        "end": w_end + offset,
                         "confidence": w.get("confidence", 0),
                     })
 
             segments.append({
-                "start": seg_start,
-                "end": seg_end,
+                "start": seg_start + offset,
+                "end": seg_end + offset,
                 "text": seg_text,
                 "words": seg_words,
             })
@@ -156,14 +231,14 @@ def transcribe_audio_deepgram(
         # Fallback: create one segment with all words
         if words:
             segments.append({
-                "start": words[0].get("start", 0),
-                "end": words[-1].get("end", 0),
+                "start": words[0].get("start", 0) + offset,
+                "end": words[-1].get("end", 0) + offset,
                 "text": full_text,
                 "words": [
                     {
                         "word": w.get("punctuated_word", w.get("word", "")),
-                        "start": w.get("start", 0),
-                        "end": w.get("end", 0),
+                        "start": w.get("start", 0) + offset,
+                        "end": w.get("end", 0) + offset,
                         "confidence": w.get("confidence", 0),
                     }
                     for w in words
@@ -174,12 +249,170 @@ def transcribe_audio_deepgram(
         "text": full_text,
         "segments": segments,
         "language": detected_language,
-        "language_probability": 1.0,
         "duration": duration,
+    }
+
+
+def _transcribe_deepgram_chunk(
+    audio_path: str,
+    chunk_start: float,
+    chunk_end: float,
+    chunk_dir: str,
+    api_key: str,
+    language: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Cut one chunk out of audio_path and transcribe it with Deepgram."""
+    from src.video.audio_extractor import extract_audio_segment
+
+    chunk_path = extract_audio_segment(
+        audio_path,
+        chunk_start,
+        chunk_end,
+        output_path=os.path.join(chunk_dir, f"chunk_{chunk_start:.3f}.wav"),
+    )
+    result = _deepgram_listen(chunk_path, api_key, language)
+    return _parse_deepgram_result(result, language, offset=chunk_start)
+
+
+def _transcript_cache_path(audio_path: str, settings: Dict[str, Any]) -> str:
+    """Cache file for a transcription, keyed on the audio bytes and settings."""
+    with open(audio_path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    cache_root = os.getenv("WHISPER_MODEL_CACHE") or os.path.expanduser("~/.cache/transcriber")
+    return os.path.join(cache_root, "deepgram", f"{digest.hexdigest()}.json")
+
+
+def _read_cached_transcript(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Load a cached transcription, or None if there is none."""
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        return None  # Partial or corrupt entry; transcribe again
+
+
+def _write_cached_transcript(cache_path: str, result: Dict[str, Any]) -> None:
+    """Save a transcription to the cache, atomically. Failures are ignored."""
+    data = orjson.dumps(result) if orjson is not None else json.dumps(result).encode()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def transcribe_audio_deepgram(
+    audio_path: str,
+    language: Optional[str] = None,
+    chunk_seconds: Optional[float] = None,
+    max_workers: int = 8,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Transcribe audio using Deepgram API with filler word detection.
+
+    Best for capturing um, uh, like, you know, etc. Results are cached on
+    disk (under $WHISPER_MODEL_CACHE or ~/.cache/transcriber) by audio
+    content and settings, so re-running on an unchanged file skips the API.
+
+    Args:
+        audio_path: Path to audio file
+        language: Optional language code (auto-detected if None)
+        chunk_seconds: If set, split audio longer than this at silences and
+            transcribe the chunks concurrently (default: one request)
+        max_workers: Maximum concurrent chunk requests
+        use_cache: Reuse and store results in the on-disk cache
+
+    Returns:
+        Dict with text, segments, language, etc.
+    """
+    api_key = os.getenv("DEEPGRAM_API_KEY")
+    if not api_key:
+        raise ValueError("DEEPGRAM_API_KEY not found")
+
+    start_time = time.time()
+
+    cache_path = None
+    if use_cache:
+        cache_path = _transcript_cache_path(audio_path, {
+            **_DEEPGRAM_PARAMS,
+            "language": language,
+            "chunk_seconds": chunk_seconds,
+        })
+        cached = _read_cached_transcript(cache_path)
+        if cached is not None:
+            cached["processing_time"] = time.time() - start_time
+            return cached
+
+    chunks = None
+    if chunk_seconds:
+        from src.video.audio_extractor import get_video_info
+
+        total_duration = get_video_info(audio_path)["duration"]
+        chunks = _split_audio_on_silence(audio_path, total_duration, chunk_seconds)
+
+    if chunks and len(chunks) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with tempfile.TemporaryDirectory() as chunk_dir:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                parts = list(pool.map(
+                    lambda chunk: _transcribe_deepgram_chunk(
+                        audio_path, chunk[0], chunk[1], chunk_dir, api_key, language
+                    ),
+                    chunks,
+                ))
+
+        # Stitch chunks back together in time order
+        found = [part for part in parts if part is not None]
+        parsed = None
+        if found:
+            parsed = {
+                "text": " ".join(part["text"] for part in found if part["text"]),
+                "segments": [seg for part in found for seg in part["segments"]],
+                "language": found[0]["language"],
+                "duration": chunks[-1][1],
+            }
+    else:
+        parsed = _parse_deepgram_result(_deepgram_listen(audio_path, api_key, language), language)
+
+    processing_time = time.time() - start_time
+
+    if parsed is None:
+        # Not cached: an empty response may be transient, and caching it
+        # would replay it for this audio forever
+        return {
+            "text": "",
+            "segments": [],
+            "language": language or "en",
+            "language_probability": 0,
+            "duration": 0,
+            "processing_time": processing_time,
+            "model": "deepgram-nova-2",
+        }
+
+    result = {
+        "text": parsed["text"],
+        "segments": parsed["segments"],
+        "language": parsed["language"],
+        "language_probability": 1.0,
+        "duration": parsed["duration"],
         "processing_time": processing_time,
         "model": "deepgram-nova-2",
     }
 
+    if cache_path is not None:
+        _write_cached_transcript(cache_path, result)
+    return result
+
 
 def transcribe_audio_openai(
     audio_path: str,
@@ -197,13 +430,11 @@ def transcribe_audio_openai(
     Returns:
         Dict with text, segments, language, etc.
     """
-    import openai
-
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY not found")
 
-    client = openai.OpenAI(api_key=api_key)
+    client = _openai_client(api_key)
 
     start_time = time.time()
 
@@ -233,23 +464,29 @@ def transcribe_audio_openai(
 
     # Add word-level timestamps
     if response.words:
+        # Read each word's fields once; a word that ends one segment's scan
+        # is looked at again by the next segment
+        words = [
+            (getattr(word, "start", 0), getattr(word, "end", 0), getattr(word, "word", ""))
+            for word in response.words
+        ]
         word_idx = 0
         for seg in segments:
             seg_words = []
-            while word_idx < len(response.words):
-                word = response.words[word_idx]
-                word_start = getattr(word, "start", 0)
-                word_end = getattr(word, "end", 0)
+            seg_start = seg["start"]
+            limit = seg["end"] + 0.5
+            while word_idx < len(words):
+                word_start, word_end, text = words[word_idx]
 
                 # Check if word belongs to this segment
-                if word_start >= seg["start"] and word_end <= seg["end"] + 0.5:
+                if word_start >= seg_start and word_end <= limit:
                     seg_words.append({
-                        "word": getattr(word, "word", ""),
+                        "word": text,
                         "start": word_start,
                         "end": word_end,
                     })
                     word_idx += 1
-                elif word_start > seg["end"] + 0.5:
+                elif word_start > limit:
                     break
                 else:
                     word_idx += 1
@@ -361,6 +598,8 @@ def transcribe_audio_local(
 def transcribe_audio(
     audio_path: str,
     language: Optional[str] = None,
+    chunk_seconds: Optional[float] = None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Transcribe audio file with word-level timestamps using Deepgram.
@@ -370,11 +609,16 @@ def transcribe_audio(
     Args:
         audio_path: Path to audio file
         language: Optional language code (auto-detected if None)
+        chunk_seconds: Transcribe long audio as concurrent chunks of about
+            this length (default: one request)
+        use_cache: Reuse and store results in the on-disk transcript cache
 
     Returns:
         Dictionary with text, segments, language, duration, etc.
     """
-    return transcribe_audio_deepgram(audio_path, language)
+    return transcribe_audio_deepgram(
+        audio_path, language, chunk_seconds=chunk_seconds, use_cache=use_cache,
+    )
 
 
 def main(audio_path: str) -> Dict[str, Any]:
@@ -32,7 +32,7 @@ from pathlib import Path
 
 from src.video.export_formats import ExportFormat, FormatSpec, get_format
 from src.video.crop_calculator import CropResult, CropRegion
-from src.video.edit_sync import VideoEditPlan, VideoEditSegment
+from src.video.edit_sync import VideoEditPlan, VideoEditSegment, filter_complex_args
 from src.video.caption_styles import CaptionStyle, get_caption_style
 from src.video.caption_generator import generate_captions, save_captions
 
@@ -110,6 +110,11 @@ def build_ffmpeg_filter(
             filters.append(
                 f"[{input_label}]trim={seg.start:.6f}:{seg.end:.6f},setpts=PTS-STARTPTS[{current_label}]"
             )
+        elif edit_plan.prefers_select_filter:
+            # Many segments - one select filter instead of a split/concat graph
+            filters.append(
+                f"[{input_label}]{edit_plan.generate_ffmpeg_select_expr()}[{current_label}]"
+            )
         else:
             # Multiple segments - split, trim, concat
             segment_labels = []
@@ -271,29 +276,30 @@ def render_video(
         if audio_path:
             cmd.extend(["-i", audio_path])
 
+        segment_count = len(edit_plan.segments) if edit_plan else 0
+
+        # Trimmed audio has to share filter_complex with the video, so decide
+        # on it before the filter (or its script file) is written.
+        audio_filter = None
+        if not audio_path and edit_plan and edit_plan.segments:
+            audio_filter = build_audio_filter(edit_plan)
+            if audio_filter:
+                filter_complex = filter_complex + ";" + audio_filter
+
         # Video filter
-        cmd.extend(["-filter_complex", filter_complex])
+        filter_args, script_path = filter_complex_args(filter_complex, segment_count)
+        if script_path:
+            temp_files.append(script_path)
+        cmd.extend(filter_args)
         cmd.extend(["-map", "[outv]"])
 
         # Audio handling
         if audio_path:
             # Use separate audio file
             cmd.extend(["-map", "1:a"])
-        elif edit_plan and edit_plan.segments:
-            # Build audio filter for trimming
-            audio_filter = build_audio_filter(edit_plan)
-            if audio_filter:
-                # We need to include audio in filter_complex
-                # Rebuild the entire filter with audio
-                full_filter = filter_complex + ";" + audio_filter
-                # Re-run with updated filter
-                cmd = ["ffmpeg"]
-                if overwrite:
-                    cmd.append("-y")
-                cmd.extend(["-i", video_path])
-                cmd.extend(["-filter_complex", full_filter])
-                cmd.extend(["-map", "[outv]", "-map", "[outa]"])
-        else:
+        elif audio_filter:
+            cmd.extend(["-map", "[outa]"])
+        elif not (edit_plan and edit_plan.segments):
             # Copy audio as-is
             cmd.extend(["-map", "0:a"])
 